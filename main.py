@@ -1,30 +1,38 @@
-import warnings
+import sys
 
-# Suppress Pydantic v1 compatibility warning in Python 3.14
-warnings.filterwarnings("ignore", message="Core Pydantic V1 functionality")
-
-from langchain_core.messages import HumanMessage
-from langgraph.types import Command
-
-# Use the LangGraph-based agent
-from src.graph.f150_graph import create_f150_graph
-from src.utils.approval_node import format_approval_prompt_for_cli
+# Heavy LangChain/LangGraph imports are deferred into the functions that use
+# them, so an invalid config fails fast without paying their import cost
 from src.config import Config
-from src.rag import create_vector_store
+
+# Commands that end the session (compared case-insensitively)
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+_STARTUP_BANNER = "\n".join([
+    "=" * 70,
+    "F150 EXPERT AGENT (LangGraph) - INITIALIZING",
+    "=" * 70,
+    "",
+    "Step 1: Loading 2018 Ford F-150 Owner's Manual...",
+    "  - Reading PDF (641 pages)",
+    "  - Creating chunks (~1510 chunks)",
+    "  - Generating embeddings",
+    "  ⏳ First run may take 15-30 seconds (cached afterwards)...",
+    "",
+]) + "\n"
+
+_SESSION_SUMMARY_TEMPLATE = "\n".join([
+    "Total tokens used: {total_tokens:,}",
+    "  Prompt tokens: {total_prompt_tokens:,}",
+    "  Completion tokens: {total_completion_tokens:,}",
+    "Total interactions: {total_interactions}",
+    "Final context usage: {usage_percentage:.1f}%",
+    "Remaining tokens: {remaining_tokens:,}",
+])
 
 
 def print_startup_banner():
     """Print the startup initialization banner."""
-    print("=" * 70)
-    print("F150 EXPERT AGENT (LangGraph) - INITIALIZING")
-    print("=" * 70)
-    print()
-    print("Step 1: Loading 2018 Ford F-150 Owner's Manual...")
-    print("  - Reading PDF (641 pages)")
-    print("  - Creating chunks (1649 chunks)")
-    print("  - Generating embeddings")
-    print("  ⏳ This may take 15-30 seconds...")
-    print()
+    sys.stdout.write(_STARTUP_BANNER)
 
 def print_welcome_message():
     """Print the welcome message for the interactive loop."""
@@ -38,52 +46,108 @@ def print_welcome_message():
     print("\nType 'quit' to exit")
     print("=" * 70)
 
-def print_session_summary(agent):
+def print_session_summary(agent, config):
     """Print the session summary when exiting."""
-    print("\n" + "=" * 70)
-    print("SESSION SUMMARY")
-    print("=" * 70)
+    rule = "=" * 70
 
     # Get the final state from the checkpointer
     try:
-        state = agent.get_state({"configurable": {"thread_id": "1"}})
+        state = agent.get_state(config)
         total_tokens = state.values.get("total_tokens", 0)
-        total_prompt_tokens = state.values.get("total_prompt_tokens", 0)
-        total_completion_tokens = state.values.get("total_completion_tokens", 0)
         context_limit = state.values.get("context_limit", 128000)
 
-        usage_percentage = (total_tokens / context_limit) * 100 if context_limit > 0 else 0
-        remaining_tokens = context_limit - total_tokens
-
         # Count interactions by counting user messages
         messages = state.values.get("messages", [])
-        interactions = sum(1 for m in messages if hasattr(m, 'type') and m.type == 'human')
-
-        print(f"Total tokens used: {total_tokens:,}")
-        print(f"  Prompt tokens: {total_prompt_tokens:,}")
-        print(f"  Completion tokens: {total_completion_tokens:,}")
-        print(f"Total interactions: {interactions}")
-        print(f"Final context usage: {usage_percentage:.1f}%")
-        print(f"Remaining tokens: {remaining_tokens:,}")
+
+        body = _SESSION_SUMMARY_TEMPLATE.format_map({
+            "total_tokens": total_tokens,
+            "total_prompt_tokens": state.values.get("total_prompt_tokens", 0),
+            "total_completion_tokens": state.values.get("total_completion_tokens", 0),
+            "total_interactions": sum(1 for m in messages if hasattr(m, 'type') and m.type == 'human'),
+            "usage_percentage": (total_tokens / context_limit) * 100 if context_limit > 0 else 0,
+            "remaining_tokens": context_limit - total_tokens,
+        })
     except Exception as e:
-        print(f"Unable to retrieve session summary: {e}")
+        body = f"Unable to retrieve session summary: {e}"
 
-    print("=" * 70)
+    # One write instead of a print() per line
+    sys.stdout.write(f"\n{rule}\nSESSION SUMMARY\n{rule}\n{body}\n{rule}\n")
+
+def stream_response(agent, graph_input, config):
+    """
+    Stream the agent's answer to stdout as tokens arrive.
+
+    Streams both LLM tokens ("messages") and node updates ("updates") so we
+    can print tokens from the AGENT node live, pick up answers that don't
+    come from the LLM (e.g. the pre-filter's canned replies), and notice
+    approval interrupts.
+
+    Args:
+        agent: The LangGraph agent
+        graph_input: Input dict for a new turn, or a Command to resume
+        config: Runnable config with the thread_id
 
-def read_input(agent):
+    Returns:
+        Tuple of (final AIMessage or None, interrupt payload or None)
+    """
+    from langchain_core.messages import AIMessage, AIMessageChunk
+    from src.graph.f150_graph import NodeName
+    from src.utils.telemetry import flush_telemetry
+
+    final_message_obj = None
+    interrupt_data = None
+    header_printed = False
+
+    for mode, data in agent.stream(graph_input, config, stream_mode=["messages", "updates"]):
+        if mode == "messages":
+            chunk, metadata = data
+            if metadata.get("langgraph_node") != NodeName.AGENT:
+                continue
+            if isinstance(chunk, AIMessageChunk) and chunk.content:
+                # Let node telemetry logged so far print before the answer
+                flush_telemetry()
+                if not header_printed:
+                    sys.stdout.write("\nF150 Expert (LangGraph):\n")
+                    header_printed = True
+                sys.stdout.write(chunk.content)
+                sys.stdout.flush()
+            continue
+
+        # "updates" mode: one {node_name: state_update} dict per node
+        if "__interrupt__" in data:
+            interrupt_data = data["__interrupt__"][0].value
+            continue
+        for update in data.values():
+            if update and update.get("messages"):
+                last_message = update["messages"][-1]
+                if isinstance(last_message, AIMessage):
+                    final_message_obj = last_message
+
+    # Nothing may print after the answer, or into the next prompt
+    flush_telemetry()
+    if header_printed:
+        sys.stdout.write("\n")
+    elif final_message_obj is not None and interrupt_data is None:
+        print(f"\nF150 Expert (LangGraph):\n{final_message_obj.content}")
+
+    return final_message_obj, interrupt_data
+
+
+def read_input(agent, config):
     """
     Read user input and handle quit commands.
 
     Args:
         agent: The LangGraph agent for retrieving session summary
+        config: Runnable config with the session's thread_id
 
     Returns:
         User input string, or None if user wants to quit
     """
     user_input = input("\nYou: ").strip()
 
-    if user_input.lower() in ["quit", "exit", "q"]:
-        print_session_summary(agent)
+    if len(user_input) <= 4 and user_input.lower() in _QUIT_COMMANDS:
+        print_session_summary(agent, config)
         print("\nGoodbye!")
         return None
 
@@ -96,11 +160,21 @@ def main():
     if not Config.validate():
         return
 
+    from langgraph.types import Command
+
+    # Use the LangGraph-based agent
+    from src.graph.f150_graph import create_f150_graph
+    from src.checkpointer import get_checkpointer, get_session_thread_id
+    from src.utils.approval_node import format_approval_prompt_for_cli
+    from src.rag import load_or_create_vector_store
+    from src.cache import create_semantic_cache
+    from langchain_core.messages import HumanMessage
+
     print_startup_banner()
 
-    # Create the vector store on startup
+    # Load the vector store on startup (cached on disk after the first run)
     try:
-        vector_store = create_vector_store()
+        vector_store = load_or_create_vector_store()
         print("\n✓ Manual loaded successfully!")
     except Exception as e:
         print(f"\n❌ Error loading manual: {e}")
@@ -112,21 +186,40 @@ def main():
 
     print("\nStep 2: Initializing LangGraph agent with conversation memory...")
 
-    # Create the LangGraph agent with the vector store and checkpointer
+    # Create the LangGraph agent with the vector store, checkpointer and
+    # semantic cache (answers repeated questions without a RAG + LLM round)
     try:
-        agent = create_f150_graph(vector_store=vector_store)
+        semantic_cache = create_semantic_cache()
+        agent = create_f150_graph(
+            vector_store=vector_store,
+            checkpointer=get_checkpointer(),
+            semantic_cache=semantic_cache
+        )
         print("✓ LangGraph agent ready!")
         if Config.TOKEN_TRACKING_ENABLED:
             print("✓ Token tracking enabled (integrated in graph)")
+        if semantic_cache is not None:
+            print("✓ Semantic cache enabled (integrated in graph)")
     except Exception as e:
         print(f"❌ Error creating agent: {e}")
         return
 
+    # Load the model weights while the user reads the welcome message
+    from src.llm import warm_up_model
+    warm_up_model()
+
     # Interactive loop
+    from src.utils.cli_input import enable_input_history
+    enable_input_history()
     print_welcome_message()
 
+    # One conversation thread per session (set RESUME_THREAD_ID to continue one)
+    thread_id = get_session_thread_id()
+    config = {"configurable": {"thread_id": thread_id}}
+    print(f"Conversation id: {thread_id}")
+
     while True:
-        user_input = read_input(agent)
+        user_input = read_input(agent, config)
 
         if user_input is None:
             break
@@ -135,17 +228,15 @@ def main():
             continue
 
         try:
-            # Invoke LangGraph agent with conversation memory
-            config = {"configurable": {"thread_id": "1"}}
-            response = agent.invoke(
+            # Stream the LangGraph agent's answer with conversation memory
+            final_message_obj, interrupt_data = stream_response(
+                agent,
                 {"messages": [HumanMessage(content=user_input)]},
                 config
             )
 
             # Check if execution was interrupted for approval
-            while response.get("__interrupt__"):
-                interrupt_data = response["__interrupt__"][0].value
-
+            while interrupt_data is not None:
                 # Format and display the approval request
                 approval_prompt = format_approval_prompt_for_cli(interrupt_data)
                 print(approval_prompt, end="")
@@ -155,13 +246,15 @@ def main():
 
                 if approval_input in ['y', 'yes']:
                     # Approve - resume with True
-                    response = agent.invoke(
+                    final_message_obj, interrupt_data = stream_response(
+                        agent,
                         Command(resume={"approved": True}),
                         config
                     )
                 elif approval_input in ['n', 'no']:
                     # Reject - resume with False
-                    response = agent.invoke(
+                    final_message_obj, interrupt_data = stream_response(
+                        agent,
                         Command(resume={"approved": False}),
                         config
                     )
@@ -170,11 +263,7 @@ def main():
                     # Re-prompt (don't invoke, just loop to ask again)
                     continue
 
-            # Extract and display the final message
-            final_message_obj = response["messages"][-1]
-            print(f"\nF150 Expert (LangGraph):\n{final_message_obj.content}")
-
-            # Token tracking is now handled automatically by the token_tracker node
+            # Token tracking and semantic caching are handled by graph nodes
 
         except Exception as e:
             print(f"\nError: {str(e)}")
@@ -1,15 +1,34 @@
-import warnings
 import os
+import sys
 
-# Suppress Pydantic v1 compatibility warning in Python 3.14
-warnings.filterwarnings("ignore", message="Core Pydantic V1 functionality")
-
-from langchain_core.messages import HumanMessage
-
-from src.agent import create_f150_agent
+# Heavy LangChain imports are deferred into the functions that use them,
+# so an invalid config fails fast without paying their import cost
 from src.config import Config
-from src.rag import create_vector_store
-from src.utils.token_counter_chain import OllamaTokenCounter, extract_and_display_token_usage
+
+# Commands that end the session (compared case-insensitively)
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+_STARTUP_BANNER = "\n".join([
+    "=" * 70,
+    "F150 EXPERT AGENT - INITIALIZING",
+    "=" * 70,
+    "",
+    "Step 1: Loading 2018 Ford F-150 Owner's Manual...",
+    "  - Reading PDF (641 pages)",
+    "  - Creating chunks (~1510 chunks)",
+    "  - Generating embeddings",
+    "  ⏳ First run may take 15-30 seconds (cached afterwards)...",
+    "",
+]) + "\n"
+
+_SESSION_SUMMARY_TEMPLATE = "\n".join([
+    "Total tokens used: {total_tokens:,}",
+    "  Prompt tokens: {total_prompt_tokens:,}",
+    "  Completion tokens: {total_completion_tokens:,}",
+    "Total interactions: {total_interactions}",
+    "Final context usage: {usage_percentage:.1f}%",
+    "Remaining tokens: {remaining_tokens:,}",
+])
 
 
 def setup_langsmith_tracing():
@@ -25,10 +44,10 @@ def setup_langsmith_tracing():
             print("   Tracing will be disabled. Add your API key to .env file.")
             return False
 
-        # Set environment variables that LangChain/LangGraph automatically detect
-        os.environ["LANGSMITH_TRACING"] = "true"
-        os.environ["LANGSMITH_API_KEY"] = Config.LANGSMITH_API_KEY
-        os.environ["LANGSMITH_PROJECT"] = Config.LANGSMITH_PROJECT
+        # LANGSMITH_TRACING/LANGSMITH_API_KEY are already in os.environ (load_dotenv
+        # in src.config), which LangChain/LangGraph read directly. Only the project
+        # name may come from our default rather than the environment.
+        os.environ.setdefault("LANGSMITH_PROJECT", Config.LANGSMITH_PROJECT)
 
         print(f"✓ LangSmith tracing enabled")
         print(f"  Project: {Config.LANGSMITH_PROJECT}")
@@ -40,16 +59,7 @@ def setup_langsmith_tracing():
 
 def print_startup_banner():
     """Print the startup initialization banner."""
-    print("=" * 70)
-    print("F150 EXPERT AGENT - INITIALIZING")
-    print("=" * 70)
-    print()
-    print("Step 1: Loading 2018 Ford F-150 Owner's Manual...")
-    print("  - Reading PDF (641 pages)")
-    print("  - Creating chunks (1649 chunks)")
-    print("  - Generating embeddings")
-    print("  ⏳ This may take 15-30 seconds...")
-    print()
+    sys.stdout.write(_STARTUP_BANNER)
 
 
 def print_welcome_message():
@@ -62,19 +72,54 @@ def print_welcome_message():
     print("=" * 70)
 
 
-def print_session_summary(token_counter: OllamaTokenCounter):
+def print_session_summary(token_counter: "OllamaTokenCounter"):
     """Print the session summary when exiting."""
-    print("\n" + "=" * 70)
-    print("SESSION SUMMARY")
-    print("=" * 70)
-    summary = token_counter.get_summary()
-    print(f"Total tokens used: {summary['total_tokens']:,}")
-    print(f"  Prompt tokens: {summary['total_prompt_tokens']:,}")
-    print(f"  Completion tokens: {summary['total_completion_tokens']:,}")
-    print(f"Total interactions: {summary['total_interactions']}")
-    print(f"Final context usage: {summary['usage_percentage']:.1f}%")
-    print(f"Remaining tokens: {summary['remaining_tokens']:,}")
-    print("=" * 70)
+    rule = "=" * 70
+    body = _SESSION_SUMMARY_TEMPLATE.format_map(token_counter.get_summary())
+
+    # One write instead of a print() per line
+    sys.stdout.write(f"\n{rule}\nSESSION SUMMARY\n{rule}\n{body}\n{rule}\n")
+
+
+def stream_response(agent, user_message, config):
+    """
+    Stream the agent's answer to stdout as tokens arrive.
+
+    Only tokens from the model node are printed; tool output is not.
+
+    Args:
+        agent: The LangChain agent
+        user_message: HumanMessage for this turn
+        config: Runnable config with the thread_id
+
+    Returns:
+        The final AI message from the agent's state (for token tracking)
+    """
+    from langchain_core.messages import AIMessageChunk
+    from src.utils.telemetry import flush_telemetry
+
+    header_printed = False
+    for chunk, metadata in agent.stream({"messages": [user_message]}, config, stream_mode="messages"):
+        if metadata.get("langgraph_node") != "model":
+            continue
+        if isinstance(chunk, AIMessageChunk) and chunk.content:
+            # Let tool telemetry logged so far print before the answer
+            flush_telemetry()
+            if not header_printed:
+                sys.stdout.write("\nF150 Expert::::\n")
+                header_printed = True
+            sys.stdout.write(chunk.content)
+            sys.stdout.flush()
+
+    # Nothing may print after the answer, or into the next prompt
+    flush_telemetry()
+    final_message_obj = agent.get_state(config).values["messages"][-1]
+    if header_printed:
+        sys.stdout.write("\n")
+    else:
+        print(f"\nF150 Expert::::\n{final_message_obj.content}")
+
+    return final_message_obj
 
 
 def read_input(token_counter):
@@ -89,7 +134,7 @@ def read_input(token_counter):
     """
     user_input = input("\nYou: ").strip()
 
-    if user_input.lower() in ["quit", "exit", "q"]:
+    if len(user_input) <= 4 and user_input.lower() in _QUIT_COMMANDS:
         if token_counter:
             print_session_summary(token_counter)
         print("\nGoodbye!")
@@ -104,14 +149,20 @@ def main():
     if not Config.validate():
         return
 
+    from src.agent import create_f150_agent
+    from src.rag import load_or_create_vector_store
+    from src.cache import create_semantic_cache, forget_query_vector, remember_query_vector
+    from langchain_core.messages import HumanMessage
+    from src.utils.token_counter_chain import OllamaTokenCounter, extract_and_display_token_usage
+
     # Set up LangSmith tracing if enabled
     setup_langsmith_tracing()
 
     print_startup_banner()
 
-    # Create the vector store on startup
+    # Load the vector store on startup (cached on disk after the first run)
     try:
-        vector_store = create_vector_store()
+        vector_store = load_or_create_vector_store()
         print("\n✓ Manual loaded successfully!")
     except Exception as e:
         print(f"\n❌ Error loading manual: {e}")
@@ -137,9 +188,26 @@ def main():
         token_counter = OllamaTokenCounter(context_limit=Config.CONTEXT_LIMIT)
         print("\n✓ Token tracking enabled (using Ollama actual counts)")
 
+    # Semantic cache: answer repeated questions without a RAG + LLM round
+    semantic_cache = create_semantic_cache()
+    if semantic_cache is not None:
+        print("✓ Semantic cache enabled")
+
+    # Load the model weights while the user reads the welcome message
+    from src.llm import warm_up_model
+    warm_up_model()
+
     # Interactive loop
+    from src.utils.cli_input import enable_input_history
+    enable_input_history()
     print_welcome_message()
 
+    # One conversation thread per session (set RESUME_THREAD_ID to continue one)
+    from src.checkpointer import get_session_thread_id
+    thread_id = get_session_thread_id()
+    config = {"configurable": {"thread_id": thread_id}}
+    print(f"Conversation id: {thread_id}")
+
     while True:
         user_input = read_input(token_counter)
 
@@ -150,15 +218,28 @@ def main():
             continue
 
         try:
-            # Invoke agent
-            response = agent.invoke(
-                {"messages": [HumanMessage(content=user_input)]},
-                {"configurable": {"thread_id": "1"}}
+            # Check the semantic cache before invoking the agent
+            query_vector = None
+            if semantic_cache:
+                query_vector = semantic_cache.embed(user_input)
+                cached_answer = semantic_cache.lookup(query_vector)
+                if cached_answer:
+                    print(f"\nF150 Expert (cached)::::\n{cached_answer}")
+                    continue
+                # Let the manual search reuse the vector if it searches for the exact input
+                remember_query_vector(user_input, query_vector)
+
+            # Stream the agent's answer as it is generated
+            final_message_obj = stream_response(
+                agent,
+                HumanMessage(content=user_input),
+                config
             )
 
-            # Extract and display the final message
-            final_message_obj = response["messages"][-1]
-            print(f"\nF150 Expert::::\n{final_message_obj.content}")
+            if semantic_cache:
+                if final_message_obj.content:
+                    semantic_cache.store(query_vector, final_message_obj.content)
+                forget_query_vector(user_input)
 
             # Track token usage if enabled
             if token_counter:
@@ -1,13 +1,11 @@
-import warnings
+import sys
 
-# Suppress Pydantic v1 compatibility warning in Python 3.14
-warnings.filterwarnings("ignore", message="Core Pydantic V1 functionality")
-
-from langchain_core.messages import HumanMessage
-
-from src.agent import create_weather_agent
+# Heavy LangChain imports are deferred until after config validation
 from src.config import Config
 
+# Commands that end the session (compared case-insensitively)
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
 
 def main():
     """Run the weather agent in interactive mode."""
@@ -15,17 +13,26 @@ def main():
     if not Config.validate():
         return
 
+    from langchain_core.messages import AIMessageChunk, HumanMessage
+    from src.agent import create_weather_agent
+
     # Create the agent
     agent = create_weather_agent()
 
+    # Load the model weights in the background
+    from src.llm import warm_up_model
+    warm_up_model()
+
     # Interactive loop
+    from src.utils.cli_input import enable_input_history
+    enable_input_history("weather_history")
     print("Weather Agent - Type 'quit' to exit")
     print("=" * 50)
 
     while True:
         user_input = input("\nYou: ").strip()
 
-        if user_input.lower() in ["quit", "exit", "q"]:
+        if len(user_input) <= 4 and user_input.lower() in _QUIT_COMMANDS:
             print("Goodbye!")
             break
 
@@ -34,11 +41,16 @@ def main():
 
         try:
             # LangGraph agents expect messages format
-            response = agent.invoke({"messages": [HumanMessage(content=user_input)]})
-
-            # Extract the final message from the agent
-            final_message = response["messages"][-1].content
-            print(f"\nAgent: {final_message}")
+            # Stream tokens from the agent (LLM) node as they are generated
+            sys.stdout.write("\nAgent: ")
+            for chunk, metadata in agent.stream(
+                {"messages": [HumanMessage(content=user_input)]},
+                stream_mode="messages"
+            ):
+                if metadata.get("langgraph_node") == "agent" and isinstance(chunk, AIMessageChunk):
+                    sys.stdout.write(chunk.content)
+                    sys.stdout.flush()
+            sys.stdout.write("\n")
         except Exception as e:
             print(f"\nError: {str(e)}")
 
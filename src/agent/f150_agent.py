@@ -1,9 +1,8 @@
-from langchain_ollama import ChatOllama
 from langchain.agents import create_agent
-from langgraph.checkpoint.memory import InMemorySaver
 
-from ..config import Config
-from ..tools import search_f150_manual, search_web
+from ..checkpointer import get_checkpointer
+from ..llm import get_chat_model
+from ..tools import search_f150_manual, search_web, set_vector_store
 from ..prompts.system_prompt import F150_SYSTEM_PROMPT
 
 
@@ -17,20 +16,17 @@ def create_f150_agent(vector_store=None):
     Returns:
         A callable agent that can be invoked with {"messages": [HumanMessage(content=query)]}
     """
-    # Initialize the LLM with Ollama
-    llm = ChatOllama(
-        model=Config.LLM_MODEL,
-        temperature=Config.LLM_TEMPERATURE,
-        base_url=Config.get_ollama_base_url()
-    )
+    # Get the shared LLM (reuses its Ollama connection pool across agent builds)
+    llm = get_chat_model()
 
     # Define the tools
     # If vector_store is provided, include the manual search tool
     if vector_store is not None:
-        # Import and set up the vector store for the tool
-        from ..tools import set_vector_store
+        # Set up the vector store for the tool
         set_vector_store(vector_store)
-        tools = [search_f150_manual, search_web]
+        # Keep tool order stable so the rendered tool schema (and the prompt prefix
+        # Ollama caches) is byte-identical from turn to turn
+        tools = sorted([search_f150_manual, search_web], key=lambda t: t.name)
     else:
         tools = []
 
@@ -38,8 +34,9 @@ def create_f150_agent(vector_store=None):
     agent = create_agent(
         llm,
         tools,
-        checkpointer=InMemorySaver(),
+        checkpointer=get_checkpointer(),
         system_prompt=F150_SYSTEM_PROMPT
     )
 
     return agent
+
@@ -1,7 +1,6 @@
-from langchain_ollama import ChatOllama
 from langgraph.prebuilt import create_react_agent
 
-from ..config import Config
+from ..llm import get_chat_model
 from ..tools import get_current_location, get_weather
 
 
@@ -12,15 +11,11 @@ def create_weather_agent():
     Returns:
         A callable agent that can be invoked with {"messages": [HumanMessage(content=query)]}
     """
-    # Initialize the LLM with Ollama
-    llm = ChatOllama(
-        model=Config.LLM_MODEL,
-        temperature=Config.LLM_TEMPERATURE,
-        base_url=Config.get_ollama_base_url()
-    )
+    # Get the shared LLM (reuses its Ollama connection pool across agent builds)
+    llm = get_chat_model()
 
     # Define the tools
-    tools = [get_current_location, get_weather]
+    tools = sorted([get_current_location, get_weather], key=lambda t: t.name)
 
     # System message for the agent
     system_message = """You are a helpful weather assistant. You can help users check the weather for any location.
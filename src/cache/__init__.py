@@ -0,0 +1,10 @@
+from .semantic_cache import SemanticCache, create_semantic_cache
+from .query_vectors import forget_query_vector, recall_query_vector, remember_query_vector
+
+__all__ = [
+    "SemanticCache",
+    "create_semantic_cache",
+    "forget_query_vector",
+    "recall_query_vector",
+    "remember_query_vector",
+]
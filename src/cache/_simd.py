@@ -0,0 +1,84 @@
+"""
+Similarity kernels for the semantic cache.
+
+Cached vectors are L2-normalized and quantized to int8 with a per-vector scale
+(the largest component maps to +/-127). The int32 dot product of two quantized
+vectors times both scales approximates their cosine similarity. Scaling per
+vector matters for embeddings: with hundreds of dimensions the components of a
+normalized vector are small, and a fixed 127 scale would leave most of them
+only a few int8 levels.
+
+If numba is installed, the row dot products run as a JIT-compiled parallel
+loop with int32 accumulation, reading the int8 matrix directly. Otherwise we
+fall back to a NumPy int32 matrix-vector product, so numba is optional
+(install it with: uv sync --extra numba).
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+
+INT8_SCALE = 127
+
+
+def quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantize a normalized float vector to int8 with its own scale.
+
+    Args:
+        vector: L2-normalized float32 vector (components in [-1, 1])
+
+    Returns:
+        Tuple of (int8 vector, scale), where vector ~= int8 vector * scale
+    """
+    peak = float(np.abs(vector).max()) if vector.size else 0.0
+    if peak == 0.0:
+        return np.zeros(vector.shape, dtype=np.int8), 0.0
+    scale = peak / INT8_SCALE
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+def _numpy_dot_scores(mat, q):
+    """Dot product of every int8 row of mat with int8 q (widened to int32)."""
+    return mat.astype(np.int32) @ q.astype(np.int32)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _numba_dot_scores(mat, q):
+        """Dot product of every int8 row of mat with int8 q (rows scored in parallel)."""
+        n, dim = mat.shape
+        scores = np.empty(n, dtype=np.int32)
+        for i in prange(n):
+            s = 0
+            for j in range(dim):
+                s += np.int32(mat[i, j]) * np.int32(q[j])
+            scores[i] = s
+        return scores
+
+    _dot_scores = _numba_dot_scores
+else:
+    _dot_scores = _numpy_dot_scores
+
+
+def argmax_cosine(mat: np.ndarray, scales: np.ndarray, q: np.ndarray, q_scale: float) -> Tuple[int, float]:
+    """
+    Find the row of mat most similar to q.
+
+    Args:
+        mat: (N, D) int8 matrix of quantized normalized vectors, N >= 1
+        scales: (N,) float32 per-row scales from quantize()
+        q: (D,) int8 quantized normalized query vector
+        q_scale: Scale of q from quantize()
+
+    Returns:
+        Tuple of (row index, approximate cosine similarity)
+    """
+    scores = _dot_scores(mat, q) * scales
+    best = int(np.argmax(scores))
+    return best, float(scores[best]) * q_scale
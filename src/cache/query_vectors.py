@@ -0,0 +1,59 @@
+"""
+Per-turn question embeddings, kept in process memory only.
+
+The user's question is embedded once per turn (for the semantic cache) and the
+same vector is reused by the step that stores the final answer in the cache.
+The manual search also reuses it, but only when it searches for exactly the
+user's message: in practice that is the chain entry point (main_chain.py),
+since the graph's RAG node searches with an LLM-reformulated query. Vectors are kept here, keyed by the question text,
+rather than on the HumanMessage: messages are checkpointed, and a few
+thousand floats per turn would otherwise be written into every checkpoint of
+the thread and stay in its history.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+
+
+# Only the current turn's question is needed; a few more cover concurrent threads
+_MAX_ENTRIES = 32
+_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+
+def remember_query_vector(text: str, vector: np.ndarray) -> None:
+    """
+    Keep the embedding of a question for the rest of the turn.
+
+    Args:
+        text: The question text
+        vector: Its normalized embedding (from SemanticCache.embed)
+    """
+    key = text.strip()
+    _vectors[key] = vector
+    _vectors.move_to_end(key)
+    if len(_vectors) > _MAX_ENTRIES:
+        _vectors.popitem(last=False)
+
+
+def recall_query_vector(text: str) -> Optional[np.ndarray]:
+    """
+    Get the embedding remembered for a question.
+
+    Args:
+        text: The question text
+
+    Returns:
+        The vector, or None if the question was not embedded this turn
+    """
+    return _vectors.get(text.strip())
+
+
+def forget_query_vector(text: str) -> None:
+    """
+    Drop the embedding of a question once the turn is done with it.
+
+    Args:
+        text: The question text
+    """
+    _vectors.pop(text.strip(), None)
@@ -0,0 +1,157 @@
+"""
+Semantic prompt cache for the interactive chat loop.
+
+Users often re-ask the same FAQ in slightly different words ("towing capacity?",
+"how much can I tow?"). Instead of running the full RAG + LLM round again, we
+embed the question, compare it against previously answered questions, and
+return the stored answer when the cosine similarity is high enough.
+
+Vectors are L2-normalized and quantized to int8 (with a per-row scale) on
+insert, then stacked into one contiguous matrix, so a lookup is a pure
+dot-product scan over a quarter of the bytes float32 would need
+(see _simd.argmax_cosine).
+"""
+
+from typing import List, Optional
+import numpy as np
+
+from ._simd import argmax_cosine, quantize
+from .query_vectors import recall_query_vector, remember_query_vector
+
+
+class SemanticCache:
+    """In-process embedding-similarity cache with LRU eviction."""
+
+    def __init__(self, embeddings, threshold: float = 0.95, max_entries: int = 256):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embeddings: LangChain Embeddings instance used to embed questions
+            threshold: Minimum cosine similarity (0-1) to count as a hit
+            max_entries: Maximum cached answers before least-recently-used eviction
+        """
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None  # (max_entries, dim) int8, rows normalized
+        self._scales = np.zeros(max_entries, dtype=np.float32)  # Dequantization scale per row
+        self._responses: List[str] = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed and L2-normalize a question.
+
+        Args:
+            text: The user's question
+
+        Returns:
+            Normalized float32 vector
+        """
+        return _normalize(self.embeddings.embed_query(text))
+
+    def embed_message(self, text: str) -> np.ndarray:
+        """
+        Get the normalized embedding for a user message.
+
+        Reuses the vector remembered for the question this turn (see
+        query_vectors), and remembers a freshly embedded one, so the pre-filter
+        and the step that stores the answer embed the question only once.
+
+        Args:
+            text: Text of the user's message
+
+        Returns:
+            Normalized float32 vector
+        """
+        vector = recall_query_vector(text)
+        if vector is None:
+            vector = self.embed(text)
+            remember_query_vector(text, vector)
+        return vector
+
+    def lookup(self, query_vector: np.ndarray) -> Optional[str]:
+        """
+        Find a cached answer for a question embedding.
+
+        Args:
+            query_vector: Normalized vector from embed()
+
+        Returns:
+            The cached answer if the best match clears the threshold, None otherwise
+        """
+        count = len(self._responses)
+        if count == 0:
+            return None
+
+        best, score = argmax_cosine(self._vectors[:count], self._scales[:count], *quantize(query_vector))
+        if score < self.threshold:
+            return None
+
+        self._touch(best)
+        return self._responses[best]
+
+    def store(self, query_vector: np.ndarray, response: str) -> None:
+        """
+        Cache an answer, evicting the least recently used entry if full.
+
+        Args:
+            query_vector: Normalized vector from embed()
+            response: The agent's final answer
+        """
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, query_vector.shape[0]), dtype=np.int8)
+
+        if len(self._responses) < self.max_entries:
+            slot = len(self._responses)
+            self._responses.append(response)
+        else:
+            slot = int(np.argmin(self._last_used))
+            self._responses[slot] = response
+
+        self._vectors[slot], self._scales[slot] = quantize(query_vector)
+        self._touch(slot)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self._vectors = None
+        self._scales[:] = 0
+        self._responses = []
+        self._last_used[:] = 0
+        self._clock = 0
+
+    def _touch(self, slot: int) -> None:
+        """Mark a slot as most recently used."""
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+
+def _normalize(vector) -> np.ndarray:
+    """Convert to float32 and L2-normalize (zero vectors are returned as-is)."""
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def create_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Create a SemanticCache from Config, or None if it is disabled.
+
+    Returns:
+        SemanticCache using the configured embeddings, or None
+    """
+    from ..config import Config
+    if not Config.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    from ..rag import create_embeddings
+    return SemanticCache(
+        create_embeddings(),
+        threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+        max_entries=Config.SEMANTIC_CACHE_MAX_ENTRIES
+    )
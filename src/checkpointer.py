@@ -0,0 +1,49 @@
+"""
+Shared conversation checkpointer.
+
+Conversation state is checkpointed to SQLite so memory survives restarts.
+One saver (and one connection) is shared by every agent/graph in the process.
+Each CLI session gets its own conversation thread unless Config.RESUME_THREAD_ID
+names an earlier one.
+"""
+
+import os
+import sqlite3
+import uuid
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from .config import Config
+
+
+_checkpointer = None
+
+
+def get_checkpointer() -> SqliteSaver:
+    """
+    Get the process-wide SQLite checkpointer, creating it on first use.
+
+    Returns:
+        SqliteSaver backed by Config.CHECKPOINT_DB_PATH
+    """
+    global _checkpointer
+    if _checkpointer is None:
+        os.makedirs(os.path.dirname(Config.CHECKPOINT_DB_PATH) or ".", exist_ok=True)
+        # Graph nodes may run on worker threads, so allow cross-thread use
+        conn = sqlite3.connect(Config.CHECKPOINT_DB_PATH, check_same_thread=False)
+        # SqliteSaver.setup() switches to WAL; in WAL mode NORMAL sync is still
+        # crash-safe and skips an fsync per checkpoint write
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _checkpointer = SqliteSaver(conn)
+    return _checkpointer
+
+
+def get_session_thread_id() -> str:
+    """
+    Get the conversation thread id for a new CLI session.
+
+    Returns:
+        Config.RESUME_THREAD_ID if set (continue that conversation), otherwise
+        a fresh random id, so history and token totals start empty
+    """
+    return Config.RESUME_THREAD_ID or uuid.uuid4().hex
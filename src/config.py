@@ -1,25 +1,81 @@
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
-# Load environment variables
-load_dotenv()
+
+_env_loaded = False
+
+
+def _load_env():
+    """Load .env into os.environ (once). python-dotenv is imported only here."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def _is_true(value: str) -> bool:
+    """Parse a "true"/"false" environment value."""
+    return value.lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def _base_url(host: str, port: str) -> str:
+    """Build (and memoize) the Ollama base URL for a host/port pair."""
+    return f"http://{host}:{port}"
+
+
+class _EnvSetting:
+    """
+    Config class attribute read from the environment on first access.
+
+    .env is loaded (and python-dotenv imported) only when the first
+    environment-backed setting is read, so importing Config is nearly free.
+    The parsed value then replaces the descriptor on the class, so later
+    reads are plain attribute lookups and tests can still assign Config.X.
+    """
+
+    def __init__(self, env_var: str, default=None, cast=None):
+        """
+        Args:
+            env_var: Environment variable name
+            default: Value used when the variable is unset. A callable is
+                     called with the Config class (for derived defaults).
+            cast: Optional function applied to the string value
+        """
+        self.env_var = env_var
+        self.default = default
+        self.cast = cast
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner):
+        _load_env()
+        value = os.getenv(self.env_var)
+        if value is None:
+            value = self.default(owner) if callable(self.default) else self.default
+        if value is not None and self.cast is not None:
+            value = self.cast(value)
+        setattr(owner, self.name, value)
+        return value
 
 
 class Config:
     """Application configuration settings."""
 
     # Ollama settings
-    OLLAMA_HOST = os.getenv("OLLAMA_HOST", "localhost")
-    OLLAMA_PORT = os.getenv("OLLAMA_PORT", "11434")
-    OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2")
+    OLLAMA_HOST = _EnvSetting("OLLAMA_HOST", "localhost")
+    OLLAMA_PORT = _EnvSetting("OLLAMA_PORT", "11434")
+    OLLAMA_MODEL = _EnvSetting("OLLAMA_MODEL", "llama3.2")
 
     # API Keys
-    BRAVE_API_KEY = os.getenv("BRAVE_API_KEY")
-    LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
+    BRAVE_API_KEY = _EnvSetting("BRAVE_API_KEY")
+    LANGSMITH_API_KEY = _EnvSetting("LANGSMITH_API_KEY")
 
     # LangSmith tracing settings
-    LANGSMITH_TRACING = os.getenv("LANGSMITH_TRACING", "false").lower() == "true"
-    LANGSMITH_PROJECT = os.getenv("LANGSMITH_PROJECT", "f150-expert-agent")
+    LANGSMITH_TRACING = _EnvSetting("LANGSMITH_TRACING", "false", _is_true)
+    LANGSMITH_PROJECT = _EnvSetting("LANGSMITH_PROJECT", "f150-expert-agent")
 
     # Default settings
     DEFAULT_LOCATION = "Grand Rapids, Michigan"
@@ -28,17 +84,91 @@ class Config:
     PDF_DIRECTORY = os.path.join(os.path.dirname(__file__), "pdf")
     F150_MANUAL_PATH = os.path.join(PDF_DIRECTORY, "2018-Ford-F-150-Owners-Manual-version-5_om_EN-US_09_2018.pdf")
 
+    # PDF parsing settings
+    PDF_PARSE_WORKERS = _EnvSetting("PDF_PARSE_WORKERS", "0", int)  # 0 = one per CPU core
+
     # Chunking settings
-    CHUNK_SIZE = 1000  # Characters per chunk
-    CHUNK_OVERLAP = 200  # Overlap between chunks to preserve context
+    CHUNK_SIZE = _EnvSetting("CHUNK_SIZE", "1000", int)  # Characters per chunk
+    # Overlap between chunks. 0 by default: overlap re-embeds the same text in
+    # neighbouring chunks (200 gave ~9% more chunks) without improving retrieval
+    CHUNK_OVERLAP = _EnvSetting("CHUNK_OVERLAP", "0", int)
+    # When > 0, chunks are sized in embedding-model tokens instead of characters
+    # (CHUNK_OVERLAP is then in tokens too). Needs the tokenizers package and the
+    # model's tokenizer.json.
+    CHUNK_SIZE_TOKENS = _EnvSetting("CHUNK_SIZE_TOKENS", "0", int)
+    CHUNK_TOKENIZER_PATH = _EnvSetting("CHUNK_TOKENIZER_PATH", lambda cfg: cfg.ONNX_TOKENIZER_PATH)
 
     # Embedding settings
+    EMBEDDING_BACKEND = _EnvSetting("EMBEDDING_BACKEND", "ollama", str.lower)  # "ollama", "infinity" or "onnx"
     EMBEDDING_MODEL = "nomic-embed-text"  # Ollama embedding model
     # Other good options: mxbai-embed-large, all-minilm
 
+    # Infinity/TEI embedding server (OpenAI-compatible /embeddings endpoint)
+    INFINITY_BASE_URL = _EnvSetting("INFINITY_BASE_URL", "http://localhost:7997")
+    INFINITY_MODEL = _EnvSetting("INFINITY_MODEL", "nomic-ai/nomic-embed-text-v1.5")
+    # Local ONNX Runtime embedding model (e.g. an int8 export of nomic-embed-text)
+    ONNX_MODEL_PATH = _EnvSetting("ONNX_MODEL_PATH", "nomic-embed-text-q8.onnx")
+    ONNX_TOKENIZER_PATH = _EnvSetting("ONNX_TOKENIZER_PATH", "tokenizer.json")
+
+    EMBED_BATCH_SIZE = _EnvSetting("EMBED_BATCH_SIZE", "128", int)  # Texts per /api/embed request
+    EMBED_MAX_RETRIES = 3  # Retries on 429/503 from Ollama (exponential backoff)
+    EMBED_CONCURRENCY = _EnvSetting("EMBED_CONCURRENCY", "4", int)  # Ollama /api/embed requests in flight at once
+
+    # FAISS index: "hnsw" (approximate graph search), "flat" (exact brute force),
+    # "sq8" (brute force over int8-quantized vectors, 4x smaller) or
+    # "ivfpq" (product-quantized, ~32x smaller vectors at some recall cost).
+    # Changing the type or its build settings rebuilds the cached index.
+    FAISS_INDEX_TYPE = _EnvSetting("FAISS_INDEX_TYPE", "hnsw", str.lower)
+    HNSW_M = 16  # Graph neighbours per node
+    HNSW_EF_CONSTRUCTION = 64  # Build-time candidate list size
+    # Query-time candidate list size (recall vs latency); applied on load, no rebuild
+    HNSW_EF_SEARCH = _EnvSetting("HNSW_EF_SEARCH", "40", int)
+    IVF_NLIST = 64  # Coarse clusters (capped by the number of training vectors)
+    PQ_M = 96  # Sub-quantizers per vector (bytes per vector at 8 bits)
+    PQ_NBITS = 8  # Bits per sub-quantizer code
+    # Clusters scanned per query (recall vs latency); applied on load, no rebuild
+    IVF_NPROBE = _EnvSetting("IVF_NPROBE", "8", int)
+    # Manual searches on approximate indexes (hnsw/sq8/ivfpq) fetch this many
+    # candidates and re-rank them by exact distance (0 = off)
+    RERANK_FETCH_K = _EnvSetting("RERANK_FETCH_K", "50", int)
+
+    # Vector store cache settings
+    # Built indexes are saved here, keyed by PDF hash + embedding model
+    CACHE_DIR = _EnvSetting("F150_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "f150"))
+
+    # Per-chunk embedding cache keyed by (model, chunk text): index rebuilds only
+    # embed chunks whose text is new
+    EMBED_CACHE_ENABLED = _EnvSetting("EMBED_CACHE_ENABLED", "true", _is_true)
+    EMBED_CACHE_PATH = _EnvSetting("EMBED_CACHE_PATH", lambda cfg: os.path.join(cfg.CACHE_DIR, "embeddings.db"))
+
+    # Conversation checkpoint database (agent memory persists across restarts)
+    CHECKPOINT_DB_PATH = _EnvSetting("CHECKPOINT_DB_PATH", lambda cfg: os.path.join(cfg.CACHE_DIR, "conversations.db"))
+    # Conversation to continue (printed at startup); unset = start a new conversation
+    RESUME_THREAD_ID = _EnvSetting("RESUME_THREAD_ID")
+
+    # RAG context budget injected into the chat prompt (estimated at ~4 chars/token).
+    # Answer quality drops past ~2.5k tokens of retrieved context, and every extra
+    # token lengthens prompt processing.
+    MAX_RAG_CONTEXT_TOKENS = 2500
+
+    # Conversation history budget for the agent prompt (approximate tokens).
+    # Older turns beyond it are dropped so long threads don't re-process their
+    # whole history on every call.
+    MAX_HISTORY_TOKENS = _EnvSetting("MAX_HISTORY_TOKENS", "8000", int)
+
     # LLM settings
-    LLM_MODEL = OLLAMA_MODEL  # Use the model from environment
+    LLM_MODEL = _EnvSetting("OLLAMA_MODEL", "llama3.2")  # Use the model from environment
     LLM_TEMPERATURE = 0
+    # How long Ollama keeps the model (and its prompt KV cache) loaded between requests
+    OLLAMA_KEEP_ALIVE = _EnvSetting("OLLAMA_KEEP_ALIVE", "30m")
+    # Persistent exact-match cache of the RAG helper's LLM responses (prompt + model settings → response)
+    LLM_CACHE_ENABLED = _EnvSetting("LLM_CACHE_ENABLED", "true", _is_true)
+    LLM_CACHE_PATH = _EnvSetting("LLM_CACHE_PATH", lambda cfg: os.path.join(cfg.CACHE_DIR, "llm_cache.db"))
+
+    # Semantic cache settings (reuse answers for near-identical questions)
+    SEMANTIC_CACHE_ENABLED = _EnvSetting("SEMANTIC_CACHE_ENABLED", "true", _is_true)
+    SEMANTIC_CACHE_THRESHOLD = 0.95  # Minimum cosine similarity for a cache hit
+    SEMANTIC_CACHE_MAX_ENTRIES = 256  # LRU-evicted beyond this
 
     # Token tracking settings
     TOKEN_TRACKING_ENABLED = True
@@ -46,15 +176,24 @@ class Config:
     TOKEN_WARNING_THRESHOLD = 80.0  # Warn when reaching 80% of context
 
     # Human-in-the-loop settings
-    TOOL_APPROVAL_ENABLED = os.getenv("TOOL_APPROVAL_ENABLED", "false").lower() == "true"
+    TOOL_APPROVAL_ENABLED = _EnvSetting("TOOL_APPROVAL_ENABLED", "false", _is_true)
 
     # Telemetry/Logging settings
-    TELEMETRY = os.getenv("TELEMETRY", "true").lower() == "true"
+    TELEMETRY = _EnvSetting("TELEMETRY", "true", _is_true)
 
     @classmethod
     def get_ollama_base_url(cls) -> str:
         """Construct the Ollama base URL from host and port."""
-        return f"http://{cls.OLLAMA_HOST}:{cls.OLLAMA_PORT}"
+        return _base_url(cls.OLLAMA_HOST, cls.OLLAMA_PORT)
+
+    @classmethod
+    def get_embedding_model_name(cls) -> str:
+        """Name of the embedding model used by the active embedding backend."""
+        if cls.EMBEDDING_BACKEND == "infinity":
+            return cls.INFINITY_MODEL
+        if cls.EMBEDDING_BACKEND == "onnx":
+            return os.path.splitext(os.path.basename(cls.ONNX_MODEL_PATH))[0]
+        return cls.EMBEDDING_MODEL
 
     @classmethod
     def validate(cls) -> bool:
@@ -65,4 +204,10 @@ class Config:
         if not cls.OLLAMA_PORT:
             print("Error: OLLAMA_PORT not found. Please set it in your .env file.")
             return False
+        if cls.EMBEDDING_BACKEND not in ("ollama", "infinity", "onnx"):
+            print(f"Error: Unknown EMBEDDING_BACKEND '{cls.EMBEDDING_BACKEND}'. Use 'ollama', 'infinity' or 'onnx'.")
+            return False
+        if cls.FAISS_INDEX_TYPE not in ("hnsw", "flat", "sq8", "ivfpq"):
+            print(f"Error: Unknown FAISS_INDEX_TYPE '{cls.FAISS_INDEX_TYPE}'. Use 'hnsw', 'flat', 'sq8' or 'ivfpq'.")
+            return False
         return True
@@ -3,16 +3,32 @@ Chat Agent Node for conversational response generation.
 
 This node handles the response generation phase, using RAG context
 injected via SystemMessage without polluting conversation history.
+
+The base system prompt is always the first message and the RAG context goes
+after the history, so the prompt prefix (system prompt + earlier turns) is
+byte-identical from one call to the next and Ollama can reuse its KV cache.
 """
 
+import logging
+from itertools import islice
 from typing import Dict
 from langchain_ollama import ChatOllama
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages.utils import count_tokens_approximately, trim_messages
 from src.graph.state import F150StateWithDualContext
 from src.config import Config
+from src.utils.telemetry import get_telemetry_logger
+
+
+# RAG context message: a single % format of the retrieved context per turn
+_RAG_CONTEXT_TEMPLATE = """%s
+
+IMPORTANT: Use the retrieved context above to answer the user's question accurately.
+Reference page numbers when citing information from the manual."""
 
 
-def create_chat_agent_node(llm: ChatOllama, base_system_prompt: str):
+def create_chat_agent_node(llm: ChatOllama, base_system_prompt: str,
+                           base_system_message: SystemMessage = None):
     """
     Factory function to create a Chat agent node.
 
@@ -25,18 +41,29 @@ def create_chat_agent_node(llm: ChatOllama, base_system_prompt: str):
     Args:
         llm: ChatOllama instance with tools bound
         base_system_prompt: Base system prompt for F150 expert
+        base_system_message: Prebuilt SystemMessage for base_system_prompt
+                             (optional, built here if None)
 
     Returns:
         A node function for the LangGraph workflow
     """
 
+    # Read once per node build; the flag does not change at runtime
+    telemetry = Config.TELEMETRY
+    logger = get_telemetry_logger() if telemetry else None
+
+    # Reused on every turn (saves re-validating the message)
+    if base_system_message is None:
+        base_system_message = SystemMessage(content=base_system_prompt)
+    max_history_tokens = Config.MAX_HISTORY_TOKENS
+
     def chat_agent_node(state: F150StateWithDualContext) -> Dict:
         """
         Chat Agent node that generates conversational responses.
 
         Context Injection Strategy:
         - Creates a TEMPORARY SystemMessage with RAG context
-        - Injects it into the prompt for THIS inference only
+        - Injects it after the history for THIS inference only
         - Does NOT add it to state["messages"]
         - This prevents RAG context from accumulating in history
 
@@ -44,11 +71,8 @@ def create_chat_agent_node(llm: ChatOllama, base_system_prompt: str):
             state: Current graph state
 
         Returns:
-            Dict with new assistant message
+            Dict with new assistant message and its token counts
         """
-        if Config.TELEMETRY:
-            print("\n🤖 AGENT: Processing query and deciding on actions...")
-
         messages = state["messages"]
         rag_context = state.get("rag_context", "")
 
@@ -56,26 +80,35 @@ def create_chat_agent_node(llm: ChatOllama, base_system_prompt: str):
         prompt_messages = _build_chat_prompt(
             messages=messages,
             rag_context=rag_context,
-            base_system_prompt=base_system_prompt
+            base_system_prompt=base_system_prompt,
+            base_system_message=base_system_message,
+            max_history_tokens=max_history_tokens
         )
 
-        if Config.TELEMETRY:
-            has_rag = bool(rag_context)
-            print(f"  RAG context available: {has_rag}")
+        if telemetry:
+            logger.info(
+                "\n🤖 AGENT: Processing query and deciding on actions...\n  RAG context available: %s",
+                bool(rag_context)
+            )
 
         # Call LLM with context-injected prompt
         response = llm.invoke(prompt_messages)
 
-        if Config.TELEMETRY:
-            has_tool_calls = bool(response.tool_calls)
-            if has_tool_calls:
-                tool_names = [tc.get('name') for tc in response.tool_calls]
-                print(f"  ✓ Agent decided to call tools: {tool_names}")
+        # isEnabledFor: skip building the tool-name list if INFO is filtered out
+        if telemetry and logger.isEnabledFor(logging.INFO):
+            if response.tool_calls:
+                logger.info("  ✓ Agent decided to call tools: %s", [tc.get('name') for tc in response.tool_calls])
             else:
-                print("  ✓ Agent generated final response (no tool calls)")
+                logger.info("  ✓ Agent generated final response (no tool calls)")
 
-        # Return ONLY the assistant's message (no RAG context)
-        return {"messages": [response]}
+        # Return ONLY the assistant's message (no RAG context), plus Ollama's
+        # token counts so the token tracker doesn't have to find this message
+        metadata = response.response_metadata
+        return {
+            "messages": [response],
+            "last_prompt_tokens": metadata.get("prompt_eval_count", 0),
+            "last_completion_tokens": metadata.get("eval_count", 0),
+        }
 
     return chat_agent_node
 
@@ -83,44 +116,82 @@ def create_chat_agent_node(llm: ChatOllama, base_system_prompt: str):
 def _build_chat_prompt(
     messages: list,
     rag_context: str,
-    base_system_prompt: str
+    base_system_prompt: str,
+    base_system_message: SystemMessage = None,
+    max_history_tokens: int = None
 ) -> list:
     """
     Build the full prompt with RAG context injected via SystemMessage.
 
     This is the key mechanism for separating RAG context from chat history.
     The RAG context is injected as a SystemMessage ONLY for this inference,
-    but is NOT added to state["messages"].
+    but is NOT added to state["messages"]. It goes after the history so the
+    base system prompt + history prefix stays stable across calls.
 
     Args:
         messages: Conversation history (user + assistant messages only)
         rag_context: Formatted RAG context from retrieval
         base_system_prompt: Base system prompt defining agent behavior
+        base_system_message: Prebuilt SystemMessage for base_system_prompt
+        max_history_tokens: Keep only the most recent turns that fit this
+                            (approximate) token budget. None = full history.
 
     Returns:
         List of messages for LLM invocation
     """
-    # Start with base system prompt
-    system_content = base_system_prompt
+    system_message = base_system_message or SystemMessage(content=base_system_prompt)
 
-    # Inject RAG context if available
+    # Conversation history (this is clean - no RAG context)
+    # Check if first message is already a SystemMessage
+    if messages and isinstance(messages[0], SystemMessage):
+        # Skip the first system message from history (islice avoids copying
+        # the whole history into a temporary slice first)
+        history = islice(messages, 1, None)
+    else:
+        history = messages
+
+    if max_history_tokens is not None:
+        # Only materialize the islice; the plain history list is used as-is
+        if not isinstance(history, list):
+            history = list(history)
+        history = _trim_history(history, max_history_tokens)
+
+    # Build prompt: SystemMessage + conversation history, in one list allocation
     if rag_context:
-        system_content = f"""{base_system_prompt}
+        # Context + fixed instructions go last, after the tool result they came from
+        return [system_message, *history, SystemMessage(content=_RAG_CONTEXT_TEMPLATE % rag_context)]
+    return [system_message, *history]
 
-{rag_context}
 
-IMPORTANT: Use the retrieved context above to answer the user's question accurately.
-Reference page numbers when citing information from the manual."""
+def _trim_history(history: list, max_tokens: int) -> list:
+    """
+    Keep the most recent whole turns of history that fit a token budget.
 
-    # Build prompt: SystemMessage + conversation history
-    prompt_messages = [SystemMessage(content=system_content)]
+    The window always starts on a HumanMessage so tool calls stay paired
+    with their results. If even the current turn is over budget, the
+    current turn is kept whole.
 
-    # Add conversation history (this is clean - no RAG context)
-    # Check if first message is already a SystemMessage
-    if messages and isinstance(messages[0], SystemMessage):
-        # Skip the first system message from history
-        prompt_messages.extend(messages[1:])
-    else:
-        prompt_messages.extend(messages)
+    Args:
+        history: Conversation history without the system message
+        max_tokens: Approximate token budget for the history
 
-    return prompt_messages
+    Returns:
+        The trimmed history (the same list if nothing had to be dropped)
+    """
+    if count_tokens_approximately(history) <= max_tokens:
+        return history
+
+    trimmed = trim_messages(
+        history,
+        max_tokens=max_tokens,
+        strategy="last",
+        token_counter=count_tokens_approximately,
+        start_on="human",
+    )
+    if trimmed:
+        return trimmed
+
+    for i in range(len(history) - 1, -1, -1):
+        if isinstance(history[i], HumanMessage):
+            return history[i:]
+    return history
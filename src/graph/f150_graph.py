@@ -7,8 +7,14 @@ This module implements a fully agentic system where:
 - RAG context is injected transiently (doesn't pollute conversation history)
 
 Architecture Flow:
-    START → PRE_FILTER → AGENT → (decides to call search_f150_manual?) →
-    APPROVAL_GATE → AGENTIC_RAG or TOOLS → AGENT (loop) → TOKEN_TRACKER → END
+    START → AGENT (pre-filter, then LLM) → (decides to call search_f150_manual?) →
+    [APPROVAL_GATE] → AGENTIC_RAG and/or TOOLS → AGENT (loop) → [SEMANTIC_CACHE] →
+    TOKEN_TRACKER → END
+
+    Bracketed nodes are only in the graph when enabled (tool approval, cache).
+
+    When the agent calls both search_f150_manual and search_web in one turn,
+    AGENTIC_RAG and TOOLS run in parallel in the same step.
 
 Key Features:
 - Agent autonomously decides when RAG is needed
@@ -17,22 +23,24 @@ Key Features:
 - Sequential multi-agent pattern maintained
 """
 
-from enum import Enum
-from typing import Literal
+from typing import Dict, Final, List, Literal
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode
-from langchain_ollama import ChatOllama
-# InMemorySaver not needed - LangGraph API provides persistence
 
 from src.config import Config
-from src.tools import search_f150_manual, search_web
+from src.llm import get_chat_model, get_chat_model_with_tools
+from src.tools import search_f150_manual, search_web, set_vector_store
 from src.utils.conversational_filter import create_conversational_filter_node
 from src.utils.approval_node import create_approval_node
 from src.graph.state import F150StateWithDualContext
 from src.utils.token_counter_graph import create_token_tracking_node
 from src.graph.rag_agent_node import create_agentic_rag_node
 from src.graph.chat_agent_node import create_chat_agent_node
-from src.prompts.system_prompt import F150_CHAT_AGENT_PROMPT
+from src.graph.semantic_cache_node import create_semantic_cache_node
+from src.prompts.system_prompt import F150_CHAT_AGENT_PROMPT, F150_CHAT_AGENT_SYSTEM_MESSAGE
+from src.cache import create_semantic_cache
 
 
 # Module-level lazy singleton for vector store
@@ -43,37 +51,131 @@ def _get_vector_store():
     """Lazily initialize and return the vector store singleton."""
     global _vector_store
     if _vector_store is None:
-        from src.rag import create_vector_store
-        print("\n⏳ Loading F-150 manual (this may take 15-30 seconds)...")
-        _vector_store = create_vector_store()
+        from src.rag import load_or_create_vector_store
+        print("\n⏳ Loading F-150 manual (first run may take 15-30 seconds)...")
+        _vector_store = load_or_create_vector_store()
         print("✓ Manual loaded successfully!")
     return _vector_store
 
 
-class NodeName(str, Enum):
-    """Enum for graph node names to prevent typos and improve maintainability."""
-    PRE_FILTER = "pre_filter"
-    AGENT = "agent"
-    AGENTIC_RAG = "agentic_rag"
-    TOOLS = "tools"
-    TOKEN_TRACKER = "token_tracker"
-    APPROVAL_GATE = "approval_gate"
+def _create_tools_node(tools: list):
+    """
+    Create a node that executes every tool call except search_f150_manual.
+
+    Manual searches are handled by AGENTIC_RAG, which may run in parallel with
+    this node, so they are filtered out of the last AI message before it is
+    handed to a ToolNode (instead of producing an error message). ToolNode runs
+    the remaining calls of the message concurrently and passes the node's
+    config (callbacks, tracing, injected state) through to each tool.
+
+    Args:
+        tools: Tools this node may execute
+
+    Returns:
+        A node function for the LangGraph workflow
+    """
+    tool_node = ToolNode(tools)
+
+    def tools_node(state: F150StateWithDualContext, config: RunnableConfig) -> Dict:
+        """Execute non-manual tool calls from the last AI message."""
+        *history, last_message = state["messages"]
+        filtered_message = last_message.model_copy(update={"tool_calls": [
+            tc for tc in last_message.tool_calls
+            if tc["name"] != "search_f150_manual"
+        ]})
+
+        return tool_node.invoke({**state, "messages": [*history, filtered_message]}, config)
+
+    return tools_node
 
 
-def create_f150_graph(vector_store=None):
+class NodeName:
+    """
+    Graph node names, as constants to prevent typos.
+
+    Plain str constants rather than an Enum: LangGraph only ever uses these
+    as string keys, so there is no reason to pay for Enum member wrapping.
+    """
+    AGENT: Final = "agent"
+    AGENTIC_RAG: Final = "agentic_rag"
+    TOOLS: Final = "tools"
+    TOKEN_TRACKER: Final = "token_tracker"
+    APPROVAL_GATE: Final = "approval_gate"
+    SEMANTIC_CACHE: Final = "semantic_cache"
+
+
+def _tool_destinations(tool_calls: list) -> List[str]:
+    """
+    Map tool calls to the node(s) that execute them.
+
+    - search_f150_manual → AGENTIC_RAG
+    - any other tool → TOOLS (for search_web, etc.)
+    - both → AGENTIC_RAG and TOOLS run in parallel
+    """
+    tool_names = {tool_call.get('name') for tool_call in tool_calls}
+
+    destinations = []
+    if 'search_f150_manual' in tool_names:
+        destinations.append(NodeName.AGENTIC_RAG)
+    if tool_names - {'search_f150_manual'}:
+        destinations.append(NodeName.TOOLS)
+    return destinations
+
+
+def _create_filtered_agent_node(pre_filter_node, agent_node):
+    """
+    Fuse the conversational pre-filter into the agent node.
+
+    The pre-filter only runs at the start of a user turn (last message is the
+    user's). Running it inline instead of as its own node saves one graph step,
+    and its checkpoint write, on every turn.
+
+    Args:
+        pre_filter_node: Node from create_conversational_filter_node
+        agent_node: Node from create_chat_agent_node
+
+    Returns:
+        A node function for the LangGraph workflow
+    """
+
+    def filtered_agent_node(state: F150StateWithDualContext) -> Dict:
+        """Answer conversational/cached turns directly, otherwise call the agent."""
+        messages = state["messages"]
+        if not messages or not isinstance(messages[-1], HumanMessage):
+            # Back from tools: this turn was already filtered
+            return agent_node(state)
+
+        filtered = pre_filter_node(state)
+        if filtered.get("bypass_agent"):
+            return filtered
+
+        result = agent_node(state)
+        result["bypass_agent"] = False
+        return result
+
+    return filtered_agent_node
+
+
+def create_f150_graph(vector_store=None, checkpointer=None, semantic_cache=None):
     """
     Create a LangGraph-based F150 expert agent with agentic RAG architecture.
 
     Architecture:
-        1. PRE_FILTER: Intercept conversational-only messages
-        2. AGENT: Main agent that decides when to use RAG (via search_f150_manual tool)
-        3. APPROVAL_GATE: Human approval for tool execution (if enabled)
-        4. AGENTIC_RAG: Intelligent RAG retrieval (if search_f150_manual called)
-        5. TOOLS: Execute other tools like search_web
+        1. AGENT: Pre-filter (intercept conversational-only messages), then the
+           main agent that decides when to use RAG (via search_f150_manual tool)
+        2. APPROVAL_GATE: Human approval for tool execution (only in the graph if enabled)
+        3. AGENTIC_RAG: Intelligent RAG retrieval (if search_f150_manual called)
+        4. TOOLS: Execute other tools like search_web
+        5. SEMANTIC_CACHE: Store final answers (only if semantic_cache is given)
         6. TOKEN_TRACKER: Track token usage
 
     Args:
         vector_store: FAISS vector store for RAG. If None, will be lazily initialized.
+        checkpointer: Checkpointer for conversation memory and interrupts. Leave as
+                      None under the LangGraph API, which provides its own; the CLI
+                      passes src.checkpointer.get_checkpointer().
+        semantic_cache: Optional SemanticCache. Repeated/paraphrased questions are
+                        answered from it by the pre-filter without calling the LLM.
 
     Returns:
         Compiled StateGraph
@@ -83,98 +185,111 @@ def create_f150_graph(vector_store=None):
     if vector_store is None:
         vector_store = _get_vector_store()
 
-    # Initialize the LLM
-    llm = ChatOllama(
-        model=Config.LLM_MODEL,
-        temperature=Config.LLM_TEMPERATURE,
-        base_url=Config.get_ollama_base_url()
-    )
-
-    # Note: Don't use InMemorySaver() here - LangGraph API provides its own persistence
-    # checkpointer = InMemorySaver()  # Only needed for standalone main.py usage
+    # Shared LLM for the RAG helper calls (reuses its Ollama connection pool across
+    # graph builds); only these untracked, non-streamed calls use the response cache
+    rag_llm = get_chat_model(cached=True)
 
     # Set vector store for the search_f150_manual tool
-    from src.tools import set_vector_store
     set_vector_store(vector_store)
 
     # Configure tools - BOTH manual and web search
-    tools = [search_f150_manual, search_web]
-    llm_with_tools = llm.bind_tools(tools)
+    # (sorted by name so the tool schema prefix is stable for Ollama's prompt cache)
+    tools = sorted([search_f150_manual, search_web], key=lambda t: t.name)
+    llm_with_tools = get_chat_model_with_tools(tools)  # Bound once per process
 
     # System prompt for Agent
     system_prompt = F150_CHAT_AGENT_PROMPT
 
     # ==================== ROUTING FUNCTIONS ====================
 
-    def route_prefilter_output(state: F150StateWithDualContext) -> Literal[NodeName.AGENT, END]:  # type: ignore[valid-type]
-        """Route pre-filter decision."""
-        if state.get("bypass_agent", False):
-            return END
-        return NodeName.AGENT
+    # Final answers go through the cache node when there is a cache
+    answer_node = NodeName.SEMANTIC_CACHE if semantic_cache is not None else NodeName.TOKEN_TRACKER
+
+    # Without approval the gate is a pass-through, so leave it out of the graph
+    # and send tool calls straight to their execution nodes
+    approval_enabled = Config.TOOL_APPROVAL_ENABLED
 
-    def route_agent_output(state: F150StateWithDualContext) -> Literal[NodeName.APPROVAL_GATE, NodeName.TOKEN_TRACKER]:  # type: ignore[valid-type]
+    def route_agent_output(state: F150StateWithDualContext) -> List[Literal[NodeName.APPROVAL_GATE, NodeName.AGENTIC_RAG, NodeName.TOOLS, NodeName.SEMANTIC_CACHE, NodeName.TOKEN_TRACKER, END]]:  # type: ignore[valid-type]
         """Route Agent output based on tool calls."""
+        if state.get("bypass_agent", False):
+            return END  # Answered by the pre-filter
+
         messages = state["messages"]
-        last_message = messages[-1]
+        if not messages:
+            return NodeName.TOKEN_TRACKER
 
-        if last_message.tool_calls:
+        tool_calls = getattr(messages[-1], "tool_calls", None)
+        if not tool_calls:
+            return answer_node
+        if approval_enabled:
             return NodeName.APPROVAL_GATE
-        return NodeName.TOKEN_TRACKER
+        return _tool_destinations(tool_calls)
 
-    def route_approval_result(state: F150StateWithDualContext) -> Literal[NodeName.AGENTIC_RAG, NodeName.TOOLS]:  # type: ignore[valid-type]
+    def route_approval_result(state: F150StateWithDualContext) -> List[Literal[NodeName.AGENTIC_RAG, NodeName.TOOLS]]:  # type: ignore[valid-type]
         """
-        Route approval decision to appropriate tool execution node.
+        Route approval decision to appropriate tool execution node(s).
 
         - If search_f150_manual called → AGENTIC_RAG
-        - Otherwise → TOOLS (for search_web, etc.)
+        - If any other tool called → TOOLS (for search_web, etc.)
+        - Both → AGENTIC_RAG and TOOLS run in parallel
         """
         messages = state["messages"]
-        last_message = messages[-1]
+        tool_calls = getattr(messages[-1], "tool_calls", None) if messages else None
 
-        if not last_message.tool_calls:
+        if not tool_calls:
             # No tool calls (rejected), go back to agent
             return NodeName.AGENT  # type: ignore
 
-        # Check if any tool call is search_f150_manual
-        for tool_call in last_message.tool_calls:
-            if tool_call.get('name') == 'search_f150_manual':
-                return NodeName.AGENTIC_RAG
-
-        # Otherwise, use standard tools node
-        return NodeName.TOOLS
+        return _tool_destinations(tool_calls)
 
     # ==================== BUILD GRAPH ====================
 
     workflow = StateGraph(F150StateWithDualContext)
 
     # Add nodes
-    workflow.add_node(NodeName.PRE_FILTER, create_conversational_filter_node("2018 F-150"))
-    workflow.add_node(NodeName.AGENT, create_chat_agent_node(llm_with_tools, system_prompt))
-    workflow.add_node(NodeName.AGENTIC_RAG, create_agentic_rag_node(vector_store, llm))
-    workflow.add_node(NodeName.TOOLS, ToolNode([search_web]))  # Only web search here
+    workflow.add_node(NodeName.AGENT, _create_filtered_agent_node(
+        create_conversational_filter_node("2018 F-150", semantic_cache),
+        create_chat_agent_node(llm_with_tools, system_prompt, F150_CHAT_AGENT_SYSTEM_MESSAGE)
+    ))
+    workflow.add_node(NodeName.AGENTIC_RAG, create_agentic_rag_node(vector_store, rag_llm))
+    workflow.add_node(NodeName.TOOLS, _create_tools_node([search_web]))  # Everything but the manual
     workflow.add_node(NodeName.TOKEN_TRACKER, create_token_tracking_node(
         context_limit=Config.CONTEXT_LIMIT,
         warning_threshold=80.0
     ))
-    workflow.add_node(NodeName.APPROVAL_GATE, create_approval_node(
-        enabled=Config.TOOL_APPROVAL_ENABLED
-    ))
+    if approval_enabled:
+        workflow.add_node(NodeName.APPROVAL_GATE, create_approval_node(enabled=True))
+    if semantic_cache is not None:
+        workflow.add_node(NodeName.SEMANTIC_CACHE, create_semantic_cache_node(semantic_cache))
 
     # Add edges
-    workflow.add_edge(START, NodeName.PRE_FILTER)
-    workflow.add_conditional_edges(NodeName.PRE_FILTER, route_prefilter_output)
-    workflow.add_conditional_edges(NodeName.AGENT, route_agent_output)
-    workflow.add_conditional_edges(NodeName.APPROVAL_GATE, route_approval_result)
+    workflow.add_edge(START, NodeName.AGENT)
+    # Explicit path maps: the routers may return a list (parallel fan-out),
+    # which LangGraph can't infer destinations from for graph rendering
+    tool_nodes = [NodeName.APPROVAL_GATE] if approval_enabled else [NodeName.AGENTIC_RAG, NodeName.TOOLS]
+    workflow.add_conditional_edges(
+        NodeName.AGENT,
+        route_agent_output,
+        list(dict.fromkeys([*tool_nodes, answer_node, NodeName.TOKEN_TRACKER, END]))
+    )
+    if approval_enabled:
+        workflow.add_conditional_edges(
+            NodeName.APPROVAL_GATE,
+            route_approval_result,
+            [NodeName.AGENTIC_RAG, NodeName.TOOLS, NodeName.AGENT]
+        )
     workflow.add_edge(NodeName.AGENTIC_RAG, NodeName.AGENT)  # Loop back to agent
     workflow.add_edge(NodeName.TOOLS, NodeName.AGENT)  # Loop back to agent
+    if semantic_cache is not None:
+        workflow.add_edge(NodeName.SEMANTIC_CACHE, NodeName.TOKEN_TRACKER)
     workflow.add_edge(NodeName.TOKEN_TRACKER, END)
 
-    # Compile (no checkpointer - LangGraph API provides persistence)
-    graph = workflow.compile()
+    # Compile (LangGraph API provides persistence when checkpointer is None)
+    graph = workflow.compile(checkpointer=checkpointer)
 
     return graph
 
 
 # Pre-built graph instance for LangGraph API
 # This is created once when the module is imported by `langgraph dev`
-graph = create_f150_graph()
+graph = create_f150_graph(semantic_cache=create_semantic_cache())
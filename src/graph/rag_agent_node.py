@@ -7,12 +7,28 @@ This node implements an agentic RAG system that uses an LLM to:
 - Iteratively search if needed
 """
 
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from langchain_core.documents import Document
 from langchain_core.messages import HumanMessage, ToolMessage
 from langchain_ollama import ChatOllama
-from src.graph.state import F150StateWithDualContext
+from src.graph.state import F150StateWithDualContext, RetrievedBatch, retrieved_batch
 from src.config import Config
+from src.tools.manual_search import similarity_search
+from src.llm import get_chat_model
+from src.utils.telemetry import get_telemetry_logger
+
+
+# Max entries in each per-node LLM output cache (oldest evicted first)
+_LLM_CACHE_SIZE = 512
+
+# Preambles the LLM sometimes puts before a reformulated query
+_PREAMBLE_RE = re.compile(
+    r"(?:here's a reformulated query|here is the reformulated query|reformulated query|reformulated):",
+    re.IGNORECASE
+)
 
 
 def create_agentic_rag_node(vector_store=None, llm=None):
@@ -32,14 +48,23 @@ def create_agentic_rag_node(vector_store=None, llm=None):
         A node function for the LangGraph workflow
     """
 
-    # Create a small, fast LLM for RAG operations if not provided
+    # Use a small, fast LLM for RAG operations if not provided
     if llm is None:
-        llm = ChatOllama(
+        llm = get_chat_model(
             model="llama3.2:latest",  # Use same model for consistency
             temperature=0,  # Deterministic for RAG
-            base_url=Config.get_ollama_base_url()
+            cached=True  # Helper calls only, safe to replay from the response cache
         )
 
+    # Read once per node build; the flag does not change at runtime
+    telemetry = Config.TELEMETRY
+    logger = get_telemetry_logger() if telemetry else None
+
+    # LLM outputs for repeat questions / chunks: query → reformulation,
+    # (query, chunk hash) → relevant?
+    reformulation_cache = {}
+    relevance_cache = {}
+
     def agentic_rag_node(state: F150StateWithDualContext) -> Dict:
         """
         Agentic RAG node that intelligently retrieves documents.
@@ -65,20 +90,20 @@ def create_agentic_rag_node(vector_store=None, llm=None):
         if not query:
             return {
                 "rag_context": "",
-                "retrieved_documents": [],
+                "retrieved_documents": None,
                 "messages": [ToolMessage(
                     content="Error: No search query found",
                     tool_call_id=tool_call_id or "unknown"
                 )]
             }
 
-        if Config.TELEMETRY:
-            print("\n📚 AGENTIC_RAG: Retrieving and processing documents...")
+        if telemetry:
+            logger.info("\n📚 AGENTIC_RAG: Retrieving and processing documents...")
 
         if vector_store is None:
             return {
                 "rag_context": "",
-                "retrieved_documents": [],
+                "retrieved_documents": None,
                 "messages": [ToolMessage(
                     content="Error: Manual not loaded",
                     tool_call_id=tool_call_id
@@ -86,43 +111,46 @@ def create_agentic_rag_node(vector_store=None, llm=None):
             }
 
         # Step 1: Reformulate query using LLM for better retrieval
-        reformulated_query = _reformulate_query(query, llm)
-        if Config.TELEMETRY:
-            print(f"  Query: {query}")
+        reformulated_query = _reformulate_query(query, llm, reformulation_cache)
+        if telemetry:
             if reformulated_query != query:
-                print(f"  Reformulated: {reformulated_query}")
+                logger.info("  Query: %s\n  Reformulated: %s", query, reformulated_query)
+            else:
+                logger.info("  Query: %s", query)
 
         # Step 2: Retrieve documents with reformulated query
-        results = vector_store.similarity_search(reformulated_query, k=5)
+        results = similarity_search(vector_store, reformulated_query, k=5)
 
         # Step 3: Assess relevance and iterate if needed
-        relevant_docs = _assess_relevance(results, query, llm)
-        if Config.TELEMETRY:
-            print(f"  Found {len(relevant_docs)} relevant chunks")
+        relevant_docs = _assess_relevance(results, query, llm, relevance_cache)
+        if telemetry:
+            logger.info("  Found %d relevant chunks", len(relevant_docs))
 
         # Step 4: If insufficient relevant docs, try again with original query
         if len(relevant_docs) < 2 and reformulated_query != query:
-            if Config.TELEMETRY:
-                print("  Insufficient results, trying original query...")
-            results = vector_store.similarity_search(query, k=8)
-            relevant_docs = _assess_relevance(results, query, llm)
-            if Config.TELEMETRY:
-                print(f"  Found {len(relevant_docs)} relevant chunks (2nd attempt)")
+            if telemetry:
+                logger.info("  Insufficient results, trying original query...")
+            results = similarity_search(vector_store, query, k=8)
+            relevant_docs = _assess_relevance(results, query, llm, relevance_cache)
+            if telemetry:
+                logger.info("  Found %d relevant chunks (2nd attempt)", len(relevant_docs))
+
+        batch = retrieved_batch(relevant_docs)
 
         if not relevant_docs:
             tool_response = "No relevant information found in the F-150 Owner's Manual for this query."
         else:
             # Format context for Chat Agent (transient injection)
-            formatted_context = _format_rag_context(relevant_docs)
+            formatted_context = _format_rag_context(batch)
             tool_response = f"Retrieved {len(relevant_docs)} relevant sections from the manual."
 
-        if Config.TELEMETRY:
-            print(f"  ✓ Agentic RAG complete - context prepared")
+        if telemetry:
+            logger.info("  ✓ Agentic RAG complete - context prepared")
 
         # Return tool result + rag_context (separate from messages)
         return {
             "rag_context": formatted_context if relevant_docs else "",
-            "retrieved_documents": relevant_docs,
+            "retrieved_documents": batch,
             "messages": [ToolMessage(
                 content=tool_response,
                 tool_call_id=tool_call_id
@@ -136,34 +164,46 @@ def _extract_rag_tool_call(messages: list) -> tuple[str, str]:
     """
     Extract the search query from the search_f150_manual tool call.
 
+    This node only runs straight after the agent's tool-calling message (the
+    approval gate adds nothing on approval), so only the last message is checked.
+
     Args:
         messages: List of conversation messages
 
     Returns:
         Tuple of (query, tool_call_id)
     """
-    # Find the last AI message with tool calls
-    for msg in reversed(messages):
-        if hasattr(msg, 'tool_calls') and msg.tool_calls:
-            for tool_call in msg.tool_calls:
-                if tool_call.get('name') == 'search_f150_manual':
-                    query = tool_call.get('args', {}).get('question', '')
-                    tool_call_id = tool_call.get('id', 'unknown')
-                    return query, tool_call_id
+    tool_calls = getattr(messages[-1], "tool_calls", None) if messages else None
+    for tool_call in tool_calls or ():
+        if tool_call.get('name') == 'search_f150_manual':
+            query = tool_call.get('args', {}).get('question', '')
+            tool_call_id = tool_call.get('id', 'unknown')
+            return query, tool_call_id
     return None, None
 
 
-def _reformulate_query(query: str, llm: ChatOllama) -> str:
+def _cache_put(cache: dict, key, value) -> None:
+    """Insert into a bounded cache, evicting the oldest entry when full."""
+    if len(cache) >= _LLM_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _reformulate_query(query: str, llm: ChatOllama, cache: dict = None) -> str:
     """
     Use LLM to reformulate the query for better semantic search.
 
     Args:
         query: Original user query
         llm: LLM for reformulation
+        cache: Optional query → reformulation cache (failures are not cached)
 
     Returns:
         Reformulated query optimized for vector search
     """
+    if cache is not None and query in cache:
+        return cache[query]
+
     reformulation_prompt = f"""Reformulate this search query for a Ford F-150 Owner's Manual vector database.
 
 CRITICAL RULES:
@@ -188,26 +228,21 @@ Reformulated:"""
         reformulated = response.content.strip()
 
         # Additional cleanup: remove common preamble phrases if LLM ignores instructions
-        preambles = [
-            "here's a reformulated query:",
-            "reformulated query:",
-            "here is the reformulated query:",
-            "reformulated:",
-        ]
-        reformulated_lower = reformulated.lower()
-        for preamble in preambles:
-            if reformulated_lower.startswith(preamble):
-                reformulated = reformulated[len(preamble):].strip()
-                # Remove quotes if present
-                reformulated = reformulated.strip('"\'')
-                break
-
-        return reformulated if reformulated else query
+        match = _PREAMBLE_RE.match(reformulated)
+        if match:
+            # Remove quotes if present
+            reformulated = reformulated[match.end():].strip().strip('"\'')
+
+        reformulated = reformulated if reformulated else query
+        if cache is not None:
+            _cache_put(cache, query, reformulated)
+        return reformulated
     except:
         return query  # Fallback to original on error
 
 
-def _assess_relevance(documents: List[Document], query: str, llm: ChatOllama) -> List[Document]:
+def _assess_relevance(documents: List[Document], query: str, llm: ChatOllama,
+                      cache: dict = None) -> List[Document]:
     """
     Use LLM to assess which retrieved documents are actually relevant.
 
@@ -215,6 +250,7 @@ def _assess_relevance(documents: List[Document], query: str, llm: ChatOllama) ->
         documents: Retrieved documents
         query: Original query
         llm: LLM for relevance assessment
+        cache: Optional (query, chunk hash) → verdict cache (failures are not cached)
 
     Returns:
         List of relevant documents
@@ -226,10 +262,87 @@ def _assess_relevance(documents: List[Document], query: str, llm: ChatOllama) ->
     if len(documents) <= 5:
         return documents  # Trust top 5 from vector search
 
-    # If we have more than 5, use LLM to filter
-    relevant = []
-    for doc in documents[:10]:  # Max 10 to assess
-        assessment_prompt = f"""Is this manual excerpt relevant to the query?
+    # If we have more than 5, use LLM to filter (max 10 to assess)
+    candidates = documents[:10]
+    keys = [
+        (query, hashlib.blake2b(doc.page_content[:500].encode(), digest_size=8).digest())
+        for doc in candidates
+    ]
+    verdicts = [cache.get(key) if cache is not None else None for key in keys]
+
+    # Judge all misses in one prompt; if the reply can't be parsed, fall back
+    # to one (concurrent) Ollama round-trip per excerpt
+    pending = [i for i, verdict in enumerate(verdicts) if verdict is None]
+    if pending:
+        fresh = _judge_relevance_batch([candidates[i] for i in pending], query, llm)
+        if fresh is None:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                fresh = list(executor.map(
+                    lambda i: _judge_relevance(candidates[i], query, llm), pending
+                ))
+        for i, verdict in zip(pending, fresh):
+            verdicts[i] = verdict
+            if verdict is not None and cache is not None:
+                _cache_put(cache, keys[i], verdict)
+
+    # Include on error (conservative)
+    relevant = [doc for doc, verdict in zip(candidates, verdicts) if verdict is not False]
+
+    return relevant[:5]  # Return top 5 relevant
+
+
+_VERDICT_LINE = re.compile(r"^\W*(\d+)\W*(yes|no)\b", re.IGNORECASE)
+
+
+def _judge_relevance_batch(documents: List[Document], query: str, llm: ChatOllama):
+    """
+    Ask the LLM for a YES/NO verdict on every excerpt in a single call.
+
+    Args:
+        documents: Excerpts to judge
+        query: Original query
+        llm: LLM for relevance assessment
+
+    Returns:
+        One True/False verdict per document, or None if the call failed or
+        the reply did not cover every excerpt
+    """
+    excerpts = "\n\n".join(
+        f"[{i}] {doc.page_content[:500]}" for i, doc in enumerate(documents, 1)
+    )
+    assessment_prompt = f"""For each numbered manual excerpt, is it relevant to the query?
+
+Query: "{query}"
+
+{excerpts}
+
+Answer with one line per excerpt in the form "<number>: YES" or "<number>: NO" and nothing else:"""
+
+    try:
+        response = llm.invoke([HumanMessage(content=assessment_prompt)])
+    except:
+        return None
+
+    verdicts = {}
+    for line in response.content.splitlines():
+        match = _VERDICT_LINE.match(line.strip())
+        if match:
+            verdicts[int(match.group(1))] = match.group(2).lower() == "yes"
+
+    numbers = range(1, len(documents) + 1)
+    if any(i not in verdicts for i in numbers):
+        return None
+    return [verdicts[i] for i in numbers]
+
+
+def _judge_relevance(doc: Document, query: str, llm: ChatOllama):
+    """
+    Ask the LLM whether one excerpt is relevant to the query.
+
+    Returns:
+        True/False verdict, or None if the LLM call failed
+    """
+    assessment_prompt = f"""Is this manual excerpt relevant to the query?
 
 Query: "{query}"
 
@@ -237,34 +350,46 @@ Excerpt: "{doc.page_content[:500]}"
 
 Answer ONLY "YES" or "NO":"""
 
-        try:
-            response = llm.invoke([HumanMessage(content=assessment_prompt)])
-            if 'yes' in response.content.lower():
-                relevant.append(doc)
-        except:
-            relevant.append(doc)  # Include on error (conservative)
-
-    return relevant[:5]  # Return top 5 relevant
+    try:
+        response = llm.invoke([HumanMessage(content=assessment_prompt)])
+        return 'yes' in response.content.lower()
+    except:
+        return None
 
 
-def _format_rag_context(documents: list[Document]) -> str:
+def _format_rag_context(batch: RetrievedBatch, max_tokens: int = None) -> str:
     """
-    Format retrieved documents into a context string for the Chat Agent.
+    Format retrieved chunks into a context string for the Chat Agent.
+
+    Excerpts are added in relevance order until the token budget is spent;
+    later excerpts are dropped whole and only a lone first excerpt is cut.
 
     Args:
-        documents: List of retrieved Document objects
+        batch: Retrieved chunks (pages + contents)
+        max_tokens: Context budget (estimated at 4 chars/token).
+                    Defaults to Config.MAX_RAG_CONTEXT_TOKENS.
 
     Returns:
         Formatted string suitable for injection into Chat Agent prompt
     """
-    if not documents:
+    if not batch or not batch["contents"]:
         return ""
 
+    if max_tokens is None:
+        max_tokens = Config.MAX_RAG_CONTEXT_TOKENS
+    remaining_chars = max_tokens * 4
+
     context_parts = ["=== RETRIEVED CONTEXT FROM F-150 MANUAL ===\n"]
 
-    for i, doc in enumerate(documents, 1):
-        page = doc.metadata.get('page', 'unknown')
-        content = doc.page_content.strip()
+    for i, (page, content) in enumerate(zip(batch["pages"], batch["contents"]), 1):
+        if page < 0:
+            page = 'unknown'
+        content = content.strip()
+        if len(content) > remaining_chars:
+            if i > 1:
+                break
+            content = content[:remaining_chars]
+        remaining_chars -= len(content)
         context_parts.append(f"[Excerpt {i} - Page {page}]\n{content}\n")
 
     context_parts.append("=== END OF RETRIEVED CONTEXT ===\n")
@@ -0,0 +1,65 @@
+"""
+Semantic Cache Node for storing final answers.
+
+Runs after the Chat Agent produces a final answer (no tool calls) and stores
+it in the SemanticCache under the embedding of the user's question. The
+agent's pre-filter looks questions up in the same cache, so a repeated or
+paraphrased question skips the agent, RAG and LLM entirely.
+"""
+
+from typing import Dict
+from langchain_core.messages import HumanMessage
+from src.graph.state import F150StateWithDualContext
+from src.config import Config
+from src.cache import forget_query_vector
+from src.utils.conversational_filter import _extract_text_content
+from src.utils.telemetry import get_telemetry_logger
+
+
+def create_semantic_cache_node(semantic_cache):
+    """
+    Factory function to create a node that caches the agent's final answer.
+
+    Args:
+        semantic_cache: SemanticCache shared with the agent's pre-filter
+
+    Returns:
+        A node function for the LangGraph workflow
+    """
+    # Read once per node build; the flag does not change at runtime
+    logger = get_telemetry_logger() if Config.TELEMETRY else None
+
+    def semantic_cache_node(state: F150StateWithDualContext) -> Dict:
+        """
+        Store the last AI answer under the latest user question's embedding.
+
+        Uses the embedding the pre-filter remembered for the question, so nothing
+        is re-embedded, then forgets it. Leaves the state unchanged.
+
+        Args:
+            state: Current graph state
+
+        Returns:
+            Empty dict (no state update)
+        """
+        messages = state["messages"]
+        answer = messages[-1].content if messages else None
+        if not answer or not isinstance(answer, str):
+            return {}
+
+        question = next((m for m in reversed(messages) if isinstance(m, HumanMessage)), None)
+        if question is None:
+            return {}
+
+        text = _extract_text_content(question.content)
+        query_vector = semantic_cache.embed_message(text)
+        semantic_cache.store(query_vector, answer)
+        # The turn is done with the question's vector
+        forget_query_vector(text)
+
+        if logger:
+            logger.info("\n💾 SEMANTIC_CACHE: Answer cached (%d entries)", len(semantic_cache))
+
+        return {}
+
+    return semantic_cache_node
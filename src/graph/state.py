@@ -5,32 +5,34 @@ This module defines custom state classes that extend MessagesState
 to include additional tracking and metadata fields.
 """
 
-from typing import TypedDict, List
+import operator
+from typing import Annotated, List, Optional, TypedDict
 from langgraph.graph import MessagesState
 from langchain_core.documents import Document
 
 
-class F150StateWithTokens(MessagesState):
+class RetrievedBatch(TypedDict):
     """
-    Extended state for F150 agent that includes token tracking.
+    Retrieved manual chunks stored column-wise (struct of arrays).
 
-    This state class adds token tracking fields to the standard MessagesState,
-    allowing the graph to track context usage across the conversation and
-    persist it in the checkpointer.
+    Checkpoints serialize a list of ints and a list of strings instead of a
+    Document object (with its own metadata dict) per chunk. Plain lists keep
+    the state msgpack-safe, so the default checkpoint serializer can load it.
 
     Fields:
-        messages: List of conversation messages (from MessagesState)
-        total_tokens: Cumulative total tokens used in the conversation
-        total_prompt_tokens: Cumulative prompt tokens used
-        total_completion_tokens: Cumulative completion tokens used
-        context_limit: Maximum context window size in tokens
-        bypass_agent: Flag used by pre-filter to skip agent (from conversational_filter)
+        pages: Page number per chunk (-1 if unknown)
+        contents: Chunk text per chunk
     """
-    total_tokens: int = 0
-    total_prompt_tokens: int = 0
-    total_completion_tokens: int = 0
-    context_limit: int = 128000
-    bypass_agent: bool = False
+    pages: List[int]
+    contents: List[str]
+
+
+def retrieved_batch(documents: List[Document]) -> RetrievedBatch:
+    """Build a batch from vector store results, keeping their order."""
+    return RetrievedBatch(
+        pages=[doc.metadata.get("page", -1) for doc in documents],
+        contents=[doc.page_content for doc in documents],
+    )
 
 
 class F150StateWithDualContext(MessagesState):
@@ -46,12 +48,15 @@ class F150StateWithDualContext(MessagesState):
 
         # RAG-specific fields
         rag_context: Formatted string of retrieved documents (transient, per-query)
-        retrieved_documents: Raw Document objects from vector store (for debugging)
+        retrieved_documents: RetrievedBatch of the chunks behind rag_context (for debugging)
 
-        # Token tracking fields
+        # Token tracking fields (cumulative totals are summed by reducers,
+        # so nodes return only the increment)
         total_tokens: Cumulative total tokens used in the conversation
         total_prompt_tokens: Cumulative prompt tokens used
         total_completion_tokens: Cumulative completion tokens used
+        last_prompt_tokens: Prompt tokens of the agent's latest LLM call
+        last_completion_tokens: Completion tokens of the agent's latest LLM call
         context_limit: Maximum context window size in tokens
 
         # Control flow fields
@@ -59,12 +64,14 @@ class F150StateWithDualContext(MessagesState):
     """
     # RAG context fields
     rag_context: str = ""
-    retrieved_documents: List[Document] = []
+    retrieved_documents: Optional[RetrievedBatch] = None
 
     # Token tracking fields (maintaining backward compatibility)
-    total_tokens: int = 0
-    total_prompt_tokens: int = 0
-    total_completion_tokens: int = 0
+    total_tokens: Annotated[int, operator.add] = 0
+    total_prompt_tokens: Annotated[int, operator.add] = 0
+    total_completion_tokens: Annotated[int, operator.add] = 0
+    last_prompt_tokens: int = 0
+    last_completion_tokens: int = 0
     context_limit: int = 128000
 
     # Control flow
@@ -0,0 +1,134 @@
+"""
+Shared chat model factory.
+
+ChatOllama owns an HTTP client (and its connection pool) per instance. Building
+a fresh one for every agent/graph means reopening connections to Ollama on
+every rebuild, so all callers get their model from here instead.
+
+Models are kept loaded for Config.OLLAMA_KEEP_ALIVE so Ollama can reuse the
+KV cache of the (unchanged) system prompt + tool schema prefix across turns.
+
+Callers that ask for a cached model (the agentic RAG node's reformulation and
+relevance calls) also get their responses cached on disk by exact prompt +
+model settings when Config.LLM_CACHE_ENABLED (temperature 0, so a repeated
+prompt would get the same answer anyway). The agent's model is never cached:
+a hit would replay the old token counts into the token tracker and arrive as
+a single chunk instead of a stream.
+"""
+
+from functools import lru_cache
+import os
+import threading
+import httpx
+import ollama
+from langchain_ollama import ChatOllama
+
+from .config import Config
+
+
+@lru_cache(maxsize=1)
+def _llm_cache(path: str):
+    """Open the persistent LLM response cache (once per path)."""
+    from langchain_community.cache import SQLiteCache
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return SQLiteCache(database_path=path)
+
+
+@lru_cache(maxsize=4)
+def _cached_chat_model(model: str, temperature: float, base_url: str, cached: bool) -> ChatOllama:
+    """Build one ChatOllama per (model, temperature, base_url, cached) for the process."""
+    return ChatOllama(
+        model=model,
+        temperature=temperature,
+        base_url=base_url,
+        keep_alive=Config.OLLAMA_KEEP_ALIVE,
+        client_kwargs={"limits": httpx.Limits(max_keepalive_connections=32)},
+        cache=_llm_cache(Config.LLM_CACHE_PATH) if cached and Config.LLM_CACHE_ENABLED else None,
+    )
+
+
+def get_chat_model(model: str = None, temperature: float = None, cached: bool = False) -> ChatOllama:
+    """
+    Get the process-wide ChatOllama for a model/temperature pair.
+
+    Args:
+        model: Ollama model name. Defaults to Config.LLM_MODEL.
+        temperature: Sampling temperature. Defaults to Config.LLM_TEMPERATURE.
+        cached: Use the persistent response cache (if Config.LLM_CACHE_ENABLED).
+                Only for helper calls whose token usage is not tracked and
+                whose output is not streamed.
+
+    Returns:
+        Shared ChatOllama instance (same object for the same arguments)
+    """
+    if model is None:
+        model = Config.LLM_MODEL
+    if temperature is None:
+        temperature = Config.LLM_TEMPERATURE
+
+    return _cached_chat_model(model, temperature, Config.get_ollama_base_url(), cached)
+
+
+# (id of shared ChatOllama, tool names) → model with those tools bound
+_bound_models = {}
+
+
+def get_chat_model_with_tools(tools: list, model: str = None, temperature: float = None):
+    """
+    Get the shared ChatOllama with tools bound, binding once per process.
+
+    bind_tools serializes every tool's JSON schema, so graphs that are rebuilt
+    (e.g. per LangGraph API session) reuse the first binding instead.
+
+    Args:
+        tools: Tools to bind (identified by name)
+        model: Ollama model name. Defaults to Config.LLM_MODEL.
+        temperature: Sampling temperature. Defaults to Config.LLM_TEMPERATURE.
+
+    Returns:
+        Runnable chat model with the tools bound
+    """
+    llm = get_chat_model(model, temperature)
+    key = (id(llm), tuple(t.name for t in tools))
+    if key not in _bound_models:
+        _bound_models[key] = llm.bind_tools(tools)
+    return _bound_models[key]
+
+
+def _load_model(model: str, base_url: str):
+    """Ask Ollama to load a model (empty prompt = load only, no generation)."""
+    try:
+        ollama.Client(host=base_url).generate(
+            model=model,
+            prompt="",
+            keep_alive=Config.OLLAMA_KEEP_ALIVE,
+        )
+    except Exception:
+        pass  # Best effort - the first real request will load it anyway
+
+
+def warm_up_model(model: str = None) -> threading.Thread:
+    """
+    Load the chat model into Ollama in the background.
+
+    The first request after Ollama starts (or after keep_alive expires) pays
+    the cost of loading the weights. Calling this right after startup hides
+    that behind the user reading the welcome message.
+
+    Args:
+        model: Ollama model name. Defaults to Config.LLM_MODEL.
+
+    Returns:
+        The started daemon thread
+    """
+    if model is None:
+        model = Config.LLM_MODEL
+
+    thread = threading.Thread(
+        target=_load_model,
+        args=(model, Config.get_ollama_base_url()),
+        daemon=True,
+    )
+    thread.start()
+    return thread
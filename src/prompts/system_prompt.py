@@ -5,6 +5,9 @@ This module centralizes the system prompt used across different agent implementa
 to ensure consistent behavior and easy maintenance.
 """
 
+from typing import Final
+from langchain_core.messages import SystemMessage
+
 F150_SYSTEM_PROMPT = """You are an expert on the 2018 Ford F-150 pickup truck with master's level knowledge of the owner's manual.
 
 You have access to TWO search tools:
@@ -137,3 +140,6 @@ When answering questions:
 7. Include relevant safety warnings when appropriate
 
 Always prioritize user safety and proper vehicle operation."""
+
+# Built once at import and shared by every graph/agent node
+F150_CHAT_AGENT_SYSTEM_MESSAGE: Final[SystemMessage] = SystemMessage(content=F150_CHAT_AGENT_PROMPT)
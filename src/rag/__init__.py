@@ -1,11 +1,18 @@
-from .document_loader import load_and_chunk_pdf
+from .document_loader import iter_pdf_chunks, load_and_chunk_pdf
 from .embeddings import create_embeddings
-from .vector_store import create_vector_store, save_vector_store, load_vector_store
+from .vector_store import (
+    create_vector_store,
+    save_vector_store,
+    load_vector_store,
+    load_or_create_vector_store,
+)
 
 __all__ = [
     "load_and_chunk_pdf",
+    "iter_pdf_chunks",
     "create_embeddings",
     "create_vector_store",
     "save_vector_store",
     "load_vector_store",
+    "load_or_create_vector_store",
 ]
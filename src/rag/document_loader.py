@@ -7,13 +7,229 @@ This module handles:
 3. Preserving metadata for citation/reference
 """
 
-from typing import List
-from langchain_community.document_loaders import PyPDFLoader
+import os
+from multiprocessing import Pool
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
+import numpy as np
+from pypdf import PdfReader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
 from ..config import Config
 
+try:
+    import fitz  # PyMuPDF (optional, much faster text extraction)
+except ImportError:
+    fitz = None
+
+# Parser used by load_pdf_pages; part of the vector store cache key since the
+# two parsers lay out extracted text slightly differently
+PDF_PARSER = "pymupdf" if fitz is not None else "pypdf"
+
+# pypdf page ranges per worker process (more ranges = first pages arrive sooner)
+_RANGES_PER_WORKER = 4
+
+
+def _iter_pages(pdf_path: str, start: int, end: int) -> Iterator[Document]:
+    """
+    Extract text from a range of PDF pages with pypdf, one page at a time.
+
+    Metadata matches PyPDFLoader's per-page fields that the rest of the
+    app relies on ('source', 'page', 'page_label', 'total_pages').
+
+    Args:
+        pdf_path: Path to PDF file
+        start: First page index
+        end: Page index to stop at (exclusive)
+
+    Yields:
+        One Document per page in the range
+    """
+    reader = PdfReader(pdf_path)
+    total_pages = len(reader.pages)
+
+    for i in range(start, end):
+        yield Document(
+            page_content=reader.pages[i].extract_text().strip(),
+            metadata={
+                "source": pdf_path,
+                "total_pages": total_pages,
+                "page": i,
+                "page_label": reader.page_labels[i],
+            },
+        )
+
+
+def _extract_pages(page_range: Tuple[str, int, int]) -> List[Document]:
+    """
+    Extract a range of PDF pages (runs in a worker process).
+
+    Args:
+        page_range: Tuple of (pdf_path, start_page, end_page), end exclusive
+
+    Returns:
+        One Document per page in the range
+    """
+    return list(_iter_pages(*page_range))
+
+
+def _iter_pages_pymupdf(pdf_path: str) -> Iterator[Document]:
+    """
+    Extract every page with PyMuPDF (C extension, no worker processes needed).
+
+    Metadata matches _extract_pages, so chunks look the same to the rest of the app.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Yields:
+        One Document per page, in page order
+    """
+    with fitz.open(pdf_path) as pdf:
+        total_pages = pdf.page_count
+        for i, page in enumerate(pdf):
+            yield Document(
+                page_content=page.get_text("text").strip(),
+                metadata={
+                    "source": pdf_path,
+                    "total_pages": total_pages,
+                    "page": i,
+                    "page_label": page.get_label() or str(i + 1),
+                },
+            )
+
+
+def iter_pdf_pages(pdf_path: str, workers: int = None) -> Iterator[Document]:
+    """
+    Yield one Document per page as soon as its page range has been parsed.
+
+    With PyMuPDF installed (uv sync --extra pdf) pages are extracted by its C
+    parser in-process. Otherwise pypdf's pure-Python parser is used; its text
+    extraction is CPU-bound and pages are independent, so the page list is
+    split into contiguous ranges parsed by a pool of worker processes. There
+    are a few ranges per worker so the first pages arrive early and a consumer
+    (e.g. the embedding stage) can start while later pages are still parsing.
+
+    Args:
+        pdf_path: Path to PDF file
+        workers: Number of worker processes. Defaults to Config.PDF_PARSE_WORKERS,
+                 or the CPU count if that is 0.
+
+    Yields:
+        Documents in page order
+    """
+    if fitz is not None:
+        yield from _iter_pages_pymupdf(pdf_path)
+        return
+
+    if workers is None:
+        workers = Config.PDF_PARSE_WORKERS or os.cpu_count() or 1
+
+    num_pages = len(PdfReader(pdf_path).pages)
+    workers = max(1, min(workers, num_pages))
+
+    if workers == 1:
+        yield from _iter_pages(pdf_path, 0, num_pages)
+        return
+
+    step = -(-num_pages // (workers * _RANGES_PER_WORKER))  # Ceiling division
+    ranges = [(pdf_path, start, min(start + step, num_pages)) for start in range(0, num_pages, step)]
+
+    with Pool(workers) as pool:
+        for group in pool.imap(_extract_pages, ranges):
+            yield from group
+
+
+def load_pdf_pages(pdf_path: str, workers: int = None) -> List[Document]:
+    """
+    Load a PDF into one Document per page (see iter_pdf_pages).
+
+    Args:
+        pdf_path: Path to PDF file
+        workers: Number of worker processes. Defaults to Config.PDF_PARSE_WORKERS,
+                 or the CPU count if that is 0.
+
+    Returns:
+        List of Documents in page order
+    """
+    return list(iter_pdf_pages(pdf_path, workers))
+
+
+def _token_length_function(tokenizer_path: str) -> Callable[[str], int]:
+    """
+    Build a length function that counts embedding-model tokens.
+
+    Args:
+        tokenizer_path: Path to the HuggingFace tokenizer.json of the embedding model
+
+    Returns:
+        Function mapping text to its token count (without special tokens)
+    """
+    try:
+        from tokenizers import Tokenizer
+    except ImportError as e:
+        raise ImportError(
+            "CHUNK_SIZE_TOKENS requires the tokenizers package. "
+            "Install it with: uv sync --extra onnx"
+        ) from e
+
+    tokenizer = Tokenizer.from_file(tokenizer_path)
+    return lambda text: len(tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def _make_text_splitter() -> Tuple[RecursiveCharacterTextSplitter, str]:
+    """
+    Build the chunk splitter from Config.
+
+    RecursiveCharacterTextSplitter tries to split on natural boundaries:
+    1. Paragraphs (\\n\\n)
+    2. Sentences (\\n)
+    3. Words (spaces)
+    4. Characters (last resort)
+
+    Chunk length is measured in characters, or in embedding-model tokens when
+    Config.CHUNK_SIZE_TOKENS is set (chunks then match the model's input budget).
+
+    Returns:
+        Tuple of (splitter, length unit for display: "chars" or "tokens")
+    """
+    if Config.CHUNK_SIZE_TOKENS:
+        chunk_size, unit = Config.CHUNK_SIZE_TOKENS, "tokens"
+        length_function = _token_length_function(Config.CHUNK_TOKENIZER_PATH)
+    else:
+        chunk_size, unit = Config.CHUNK_SIZE, "chars"
+        length_function = len
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=Config.CHUNK_OVERLAP,
+        length_function=length_function,
+        is_separator_regex=False,
+    )
+    return splitter, unit
+
+
+def iter_pdf_chunks(pdf_path: str = None) -> Iterator[Document]:
+    """
+    Yield chunks page by page while the rest of the PDF is still being parsed.
+
+    Produces the same chunks, in the same order, as load_and_chunk_pdf (the
+    splitter never merges text across pages), so a consumer such as
+    create_vector_store can embed early chunks while later pages are parsed.
+
+    Args:
+        pdf_path: Path to PDF file. Defaults to F150 manual path from config.
+
+    Yields:
+        Document chunks with their page metadata
+    """
+    if pdf_path is None:
+        pdf_path = Config.F150_MANUAL_PATH
+
+    text_splitter, _ = _make_text_splitter()
+    for page in iter_pdf_pages(pdf_path):
+        yield from text_splitter.split_documents([page])
+
 
 def load_and_chunk_pdf(pdf_path: str = None) -> List[Document]:
     """
@@ -39,49 +255,67 @@ def load_and_chunk_pdf(pdf_path: str = None) -> List[Document]:
     print(f"Loading PDF from: {pdf_path}")
 
     # Load the PDF
-    # PyPDFLoader extracts text page-by-page and preserves page numbers
-    loader = PyPDFLoader(pdf_path)
-    documents = loader.load()
+    # Pages are extracted with PyMuPDF if installed, else in parallel pypdf
+    # worker processes, preserving page numbers
+    documents = load_pdf_pages(pdf_path)
 
     print(f"Loaded {len(documents)} pages from PDF")
 
-    # Split documents into chunks
-    # RecursiveCharacterTextSplitter tries to split on natural boundaries:
-    # 1. Paragraphs (\n\n)
-    # 2. Sentences (\n)
-    # 3. Words (spaces)
-    # 4. Characters (last resort)
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=Config.CHUNK_SIZE,
-        chunk_overlap=Config.CHUNK_OVERLAP,
-        length_function=len,  # Use character count
-        is_separator_regex=False,
-    )
-
-    # Split all documents into chunks
+    # Split all documents into chunks on natural boundaries
+    text_splitter, unit = _make_text_splitter()
     chunks = text_splitter.split_documents(documents)
 
     print(f"Split into {len(chunks)} chunks")
-    print(f"Chunk size: {Config.CHUNK_SIZE} chars, overlap: {Config.CHUNK_OVERLAP} chars")
+    print(f"Chunk size: {Config.CHUNK_SIZE_TOKENS or Config.CHUNK_SIZE} {unit}, overlap: {Config.CHUNK_OVERLAP} {unit}")
 
     return chunks
 
 
-def preview_chunks(chunks: List[Document], num_samples: int = 3):
+def _sample_chunks(chunks: Iterable[Document], num_samples: int) -> List[Document]:
+    """
+    Pick up to num_samples chunks uniformly at random.
+
+    A list is sampled by index; any other iterable (e.g. a generator of
+    chunks) is reservoir-sampled in one pass without materializing it.
+
+    Args:
+        chunks: Chunks to sample from
+        num_samples: Maximum number of chunks to return
+
+    Returns:
+        The sampled chunks
+    """
+    rng = np.random.default_rng()
+
+    if isinstance(chunks, Sequence):
+        indices = rng.choice(len(chunks), size=min(num_samples, len(chunks)), replace=False)
+        return [chunks[i] for i in indices]
+
+    # Algorithm R: item i replaces a random reservoir slot with probability k/(i+1)
+    reservoir = []
+    for i, chunk in enumerate(chunks):
+        if i < num_samples:
+            reservoir.append(chunk)
+        else:
+            slot = rng.integers(i + 1)
+            if slot < num_samples:
+                reservoir[slot] = chunk
+    return reservoir
+
+
+def preview_chunks(chunks: Iterable[Document], num_samples: int = 3):
     """
     Print preview of document chunks for inspection.
 
     Args:
-        chunks: List of Document objects from load_and_chunk_pdf()
+        chunks: Documents from load_and_chunk_pdf() (a list or any iterable)
         num_samples: Number of random chunks to display
     """
-    import random
-
     print("\n" + "=" * 70)
     print("CHUNK PREVIEW")
     print("=" * 70)
 
-    sample_chunks = random.sample(chunks, min(num_samples, len(chunks)))
+    sample_chunks = _sample_chunks(chunks, num_samples)
 
     for i, chunk in enumerate(sample_chunks, 1):
         print(f"\nSample {i}:")
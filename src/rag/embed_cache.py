@@ -0,0 +1,90 @@
+"""
+Content-addressed cache of chunk embeddings.
+
+The vector store cache (see vector_store.py) is all-or-nothing: changing the
+chunk size, the index type or a single page of the PDF rebuilds the index and
+re-embeds every chunk. Most chunk texts survive those changes unchanged, so
+each vector is also stored here under a hash of (embedding model, chunk text)
+and only texts that were never embedded before are sent to the server.
+
+Vectors are stored as float32 bytes in a SQLite file (FAISS stores float32
+anyway), so no extra dependency is needed.
+"""
+
+import hashlib
+import os
+import sqlite3
+from contextlib import closing
+from typing import Callable, List, Sequence
+import numpy as np
+
+
+# SQLite's default limit on bound parameters per statement is 999 on older builds
+_LOOKUP_BATCH = 500
+
+
+def _key(model: str, text: str) -> bytes:
+    """Digest identifying one (model, text) pair."""
+    return hashlib.blake2b(f"{model}\x00{text}".encode(), digest_size=16).digest()
+
+
+class EmbedCache:
+    """SQLite-backed map of blake2b(model + text) → embedding vector."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite database path. Parent directories are created.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        with closing(self._connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection (one per call, so the cache can be used from any thread; caller closes it)."""
+        return sqlite3.connect(self.path)
+
+    def get_or_compute_many(
+        self,
+        texts: Sequence[str],
+        model: str,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """
+        Look up each text's vector, embedding only the misses.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model name (part of the key, so models never mix)
+            embed_fn: Called once with the list of cache misses, e.g.
+                      embeddings.embed_documents
+
+        Returns:
+            One vector per text, in input order
+        """
+        keys = [_key(model, text) for text in texts]
+        found = {}
+
+        with closing(self._connect()) as conn, conn:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+            misses = [i for i, key in enumerate(keys) if key not in found]
+            if misses:
+                vectors = embed_fn([texts[i] for i in misses])
+                rows = []
+                for i, vector in zip(misses, vectors):
+                    found[keys[i]] = vector
+                    rows.append((keys[i], np.asarray(vector, dtype=np.float32).tobytes()))
+                conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+
+        return [found[key] for key in keys]
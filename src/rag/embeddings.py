@@ -5,16 +5,200 @@ Embeddings capture semantic meaning - similar text gets similar vectors.
 This enables semantic search: finding relevant chunks based on meaning, not just keywords.
 """
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import httpx
+import numpy as np
+from langchain_core.embeddings import Embeddings
 from langchain_ollama import OllamaEmbeddings
+from ollama import ResponseError
 from ..config import Config
 
 
+# HTTP statuses that mean "Ollama is busy, try again shortly"
+_RETRYABLE_STATUS_CODES = {429, 503}
+
+
+class BatchedOllamaEmbeddings(OllamaEmbeddings):
+    """
+    OllamaEmbeddings that sends documents to /api/embed in fixed-size batches.
+
+    The stock embed_documents() posts every text in one request, which for the
+    full manual is a single huge payload with no progress and no recovery if
+    Ollama rejects it. Batching keeps each request a predictable size while
+    still amortizing the HTTP round-trip over many chunks.
+
+    Up to `concurrency` batches are in flight at once so the round-trips
+    overlap; Ollama serves them in parallel when OLLAMA_NUM_PARALLEL > 1.
+    """
+
+    batch_size: int = 128
+    max_retries: int = 3
+    concurrency: int = 1
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches of batch_size, concatenating the results in order."""
+        batches = [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+
+        if self.concurrency > 1 and len(batches) > 1:
+            # The ollama client's connection pool is safe to share across threads
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as executor:
+                results = list(executor.map(self._embed_batch_with_retry, batches))
+        else:
+            results = map(self._embed_batch_with_retry, batches)
+
+        vectors = []
+        for batch_vectors in results:
+            vectors.extend(batch_vectors)
+        return vectors
+
+    def _embed_batch_with_retry(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch, backing off exponentially when Ollama is overloaded."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return super().embed_documents(batch)
+            except ResponseError as e:
+                if e.status_code not in _RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                    raise
+                time.sleep(2 ** attempt)
+
+
+class InfinityEmbeddings(Embeddings):
+    """
+    Embeddings served by an Infinity (or TEI) server's OpenAI-compatible API.
+
+    Infinity batches requests dynamically on the GPU, so it sustains much higher
+    throughput than Ollama's embedding path. Start it as a sidecar with:
+
+        infinity_emb v2 --model-id nomic-ai/nomic-embed-text-v1.5 --dtype float16
+    """
+
+    def __init__(self, model: str, base_url: str, batch_size: int = 128, max_retries: int = 3):
+        """
+        Initialize the Infinity client.
+
+        Args:
+            model: Model id the server was started with
+            base_url: Server URL, e.g. http://localhost:7997
+            batch_size: Texts per /embeddings request
+            max_retries: Retries on 429/503 responses (exponential backoff)
+        """
+        self.model = model
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self._client = httpx.Client(base_url=base_url, timeout=60.0)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches of batch_size, concatenating the results."""
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            vectors.extend(self._embed_batch_with_retry(texts[start:start + self.batch_size]))
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single search query."""
+        return self._embed_batch_with_retry([text])[0]
+
+    def _embed_batch_with_retry(self, batch: List[str]) -> List[List[float]]:
+        """POST one batch to /embeddings, backing off when the server is overloaded."""
+        for attempt in range(self.max_retries + 1):
+            response = self._client.post("/embeddings", json={"model": self.model, "input": batch})
+            if response.status_code in _RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                time.sleep(2 ** attempt)
+                continue
+            response.raise_for_status()
+            # OpenAI format: results may come back out of order, sort by index
+            data = sorted(response.json()["data"], key=lambda item: item["index"])
+            return [item["embedding"] for item in data]
+
+
+class OnnxEmbeddings(Embeddings):
+    """
+    Embeddings computed in-process with ONNX Runtime (no embedding server).
+
+    Runs an ONNX export of nomic-embed-text (int8-quantized exports work as-is)
+    on the CPU with mean pooling + L2 normalization, so no network round-trip
+    is needed per query. Requires the optional dependencies:
+
+        uv sync --extra onnx
+    """
+
+    def __init__(self, model_path: str, tokenizer_path: str, batch_size: int = 128, max_length: int = 8192):
+        """
+        Load the ONNX model and tokenizer.
+
+        Args:
+            model_path: Path to the .onnx model file
+            tokenizer_path: Path to the HuggingFace tokenizer.json for the model
+            batch_size: Texts per inference call
+            max_length: Truncate inputs to this many tokens
+        """
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "EMBEDDING_BACKEND=onnx requires onnxruntime and tokenizers. "
+                "Install them with: uv sync --extra onnx"
+            ) from e
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = os.cpu_count() or 1
+        self._session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+        self._tokenizer = Tokenizer.from_file(tokenizer_path)
+        self._tokenizer.enable_truncation(max_length=max_length)
+        self._tokenizer.enable_padding()
+        self.batch_size = batch_size
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches of batch_size, concatenating the results."""
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            vectors.extend(self._embed_batch(texts[start:start + self.batch_size]).tolist())
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single search query."""
+        return self._embed_batch([text])[0].tolist()
+
+    def _embed_batch(self, batch: List[str]) -> np.ndarray:
+        """Run one padded batch through the model, mean-pool and normalize."""
+        encodings = self._tokenizer.encode_batch(batch)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            inputs["token_type_ids"] = np.zeros_like(input_ids)
+
+        token_embeddings = self._session.run(None, inputs)[0]  # (batch, tokens, dim)
+
+        # Mean over real (non-padding) tokens, then L2-normalize
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        return pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+
+
 def create_embeddings():
     """
-    Create an embeddings instance using Ollama.
+    Create an embeddings instance for the configured backend.
+
+    Config.EMBEDDING_BACKEND selects the server:
+    - "ollama" (default): Ollama's /api/embed
+    - "infinity": Infinity/TEI OpenAI-compatible /embeddings
+    - "onnx": local ONNX Runtime model (no server)
+
+    Documents are embedded in batches of Config.EMBED_BATCH_SIZE per request;
+    the Ollama backend keeps Config.EMBED_CONCURRENCY batches in flight.
 
     Returns:
-        OllamaEmbeddings instance configured with your Ollama server.
+        Embeddings instance configured for the selected backend.
 
     Example:
         >>> embeddings = create_embeddings()
@@ -22,9 +206,27 @@ def create_embeddings():
         >>> print(len(vector))  # Should be 768 for nomic-embed-text
         768
     """
-    embeddings = OllamaEmbeddings(
+    if Config.EMBEDDING_BACKEND == "infinity":
+        return InfinityEmbeddings(
+            model=Config.INFINITY_MODEL,
+            base_url=Config.INFINITY_BASE_URL,
+            batch_size=Config.EMBED_BATCH_SIZE,
+            max_retries=Config.EMBED_MAX_RETRIES,
+        )
+
+    if Config.EMBEDDING_BACKEND == "onnx":
+        return OnnxEmbeddings(
+            model_path=Config.ONNX_MODEL_PATH,
+            tokenizer_path=Config.ONNX_TOKENIZER_PATH,
+            batch_size=Config.EMBED_BATCH_SIZE,
+        )
+
+    embeddings = BatchedOllamaEmbeddings(
         model=Config.EMBEDDING_MODEL,
-        base_url=Config.get_ollama_base_url()
+        base_url=Config.get_ollama_base_url(),
+        batch_size=Config.EMBED_BATCH_SIZE,
+        max_retries=Config.EMBED_MAX_RETRIES,
+        concurrency=Config.EMBED_CONCURRENCY,
     )
 
     return embeddings
@@ -40,8 +242,14 @@ def test_embeddings():
     3. Show embedding dimensions and similarity
     """
     print("Testing Ollama embeddings...\n")
-    print(f"Model: {Config.EMBEDDING_MODEL}")
-    print(f"Ollama URL: {Config.get_ollama_base_url()}\n")
+    print(f"Backend: {Config.EMBEDDING_BACKEND}")
+    print(f"Model: {Config.get_embedding_model_name()}")
+    if Config.EMBEDDING_BACKEND == "infinity":
+        print(f"Infinity URL: {Config.INFINITY_BASE_URL}\n")
+    elif Config.EMBEDDING_BACKEND == "onnx":
+        print(f"ONNX model: {Config.ONNX_MODEL_PATH}\n")
+    else:
+        print(f"Ollama URL: {Config.get_ollama_base_url()}\n")
 
     embeddings = create_embeddings()
 
@@ -64,17 +272,14 @@ def test_embeddings():
     print(f"\n✓ Successfully generated {len(vectors)} embeddings")
     print(f"✓ Vector dimension: {len(vectors[0])}")
 
-    # Calculate similarity between first two queries (about fuses)
-    # vs similarity with third query (about tires)
-    from numpy import dot
-    from numpy.linalg import norm
-
-    def cosine_similarity(a, b):
-        """Calculate cosine similarity between two vectors (0-1, higher = more similar)."""
-        return dot(a, b) / (norm(a) * norm(b))
+    # Cosine similarity of every pair in one matmul of the normalized vectors
+    matrix = np.asarray(vectors, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    similarities = matrix @ matrix.T
 
-    sim_fuse = cosine_similarity(vectors[0], vectors[1])
-    sim_different = cosine_similarity(vectors[0], vectors[2])
+    # First two queries (about fuses) vs the third query (about tires)
+    sim_fuse = similarities[0, 1]
+    sim_different = similarities[0, 2]
 
     print(f"\n✓ Similarity between fuse queries: {sim_fuse:.3f}")
     print(f"✓ Similarity fuse vs tire query: {sim_different:.3f}")
@@ -11,66 +11,323 @@ Why FAISS:
 - Works great with Python 3.14
 """
 
-from typing import List
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 
-from .document_loader import load_and_chunk_pdf
+from .document_loader import PDF_PARSER, iter_pdf_chunks
+from .embed_cache import EmbedCache
 from .embeddings import create_embeddings
 from ..config import Config
 
 
-def create_vector_store(chunks: List[Document] = None):
+def create_vector_store(chunks: Iterable[Document] = None):
     """
     Create a FAISS vector store from document chunks.
 
+    Chunks are embedded while they are being produced, so when chunks is a
+    generator (as with the default iter_pdf_chunks) PDF parsing and splitting
+    overlap with the embedding requests instead of running before them.
+
     Args:
-        chunks: List of Document objects. If None, loads F150 manual automatically.
+        chunks: Document chunks (a list or generator). If None, streams the
+                F150 manual's chunks automatically.
 
     Returns:
         FAISS vector store with indexed chunks
 
+    Raises:
+        ValueError: If there are no chunks (e.g. an empty or image-only PDF)
+
     Example:
         >>> vector_store = create_vector_store()
         >>> results = vector_store.similarity_search("What is fuse 33?", k=5)
         >>> print(results[0].page_content)
     """
-    # Load chunks if not provided
+    # Stream chunks if not provided
+    pdf_path = None
     if chunks is None:
-        print("Loading and chunking PDF...")
-        chunks = load_and_chunk_pdf()
-
-    print(f"Creating vector store from {len(chunks)} chunks...")
+        pdf_path = Config.F150_MANUAL_PATH
+        print(f"Loading, chunking and embedding PDF: {Config.F150_MANUAL_PATH}")
+        chunks = iter_pdf_chunks()
 
     # Create embeddings instance
     embeddings = create_embeddings()
 
+    # One embedding cache for the whole build (opening it creates the table)
+    cache = EmbedCache(Config.EMBED_CACHE_PATH) if Config.EMBED_CACHE_ENABLED else None
+
+    # Embed each distinct chunk text once (manuals repeat headers/legalese)
+    chunks, vectors, unique_count = _embed_unique(chunks, embeddings, cache)
+
+    if not chunks:
+        if pdf_path is not None:
+            raise ValueError(f"No text chunks to index: {pdf_path} is empty or has no extractable text")
+        raise ValueError("No text chunks to index: the chunks given are empty")
+
+    print(f"Creating vector store from {len(chunks)} chunks...")
+
     # Create FAISS vector store
     # This will:
-    # 1. Embed all chunks (convert text → vectors)
-    # 2. Build FAISS index for fast similarity search
-    # 3. Store both vectors and original text
-    vector_store = FAISS.from_documents(
-        documents=chunks,
-        embedding=embeddings
+    # 1. Build FAISS index for fast similarity search (HNSW, flat or IVF-PQ, see Config)
+    # 2. Store both vectors and original text
+    matrix = np.asarray(vectors, dtype=np.float32)
+    index = _build_index(matrix.shape[1], len(matrix))
+    if not index.is_trained:
+        # SQ8 calibrates per-dimension ranges and IVF-PQ learns its clusters and
+        # codebooks from the chunk vectors themselves
+        index.train(matrix)
+
+    vector_store = FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={}
     )
+    vector_store.add_embeddings(
+        text_embeddings=[(chunk.page_content, vector) for chunk, vector in zip(chunks, vectors)],
+        metadatas=[chunk.metadata for chunk in chunks]
+    )
+    # Exact vectors, row-aligned with the index (which may only hold lossy codes)
+    vector_store.chunk_vectors = matrix
+    _apply_search_params(vector_store)
 
     print(f"✓ Vector store created successfully!")
-    print(f"  - {len(chunks)} chunks indexed")
+    print(f"  - {len(chunks)} chunks indexed ({unique_count} unique texts embedded)")
     print(f"  - Ready for similarity search")
 
     return vector_store
 
 
+def _build_index(dimension: int, num_vectors: int) -> faiss.Index:
+    """
+    Create an empty FAISS index of the configured type.
+
+    HNSW answers a query by walking a neighbour graph instead of comparing
+    against every stored vector, at near-exact recall. SQ8 is still brute force
+    but stores each dimension as one byte (per-dimension min/max learned in
+    training), so a scan streams a quarter of the memory. IVF-PQ stores each
+    vector as PQ_M one-byte codes (96 bytes instead of 3072 for 768 dims) and
+    only scans the IVF_NPROBE nearest clusters; it must be trained before use.
+
+    Args:
+        dimension: Embedding dimension
+        num_vectors: Number of vectors that will be added (sizes IVF-PQ training)
+
+    Returns:
+        Empty L2 index (IndexHNSWFlat, IndexFlatL2, or untrained
+        IndexScalarQuantizer / IndexIVFPQ)
+    """
+    if Config.FAISS_INDEX_TYPE == "flat":
+        return faiss.IndexFlatL2(dimension)
+
+    if Config.FAISS_INDEX_TYPE == "sq8":
+        return faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+
+    if Config.FAISS_INDEX_TYPE == "ivfpq":
+        nlist, m, nbits = _ivfpq_params(dimension, num_vectors)
+        return faiss.IndexIVFPQ(faiss.IndexFlatL2(dimension), dimension, nlist, m, nbits)
+
+    index = faiss.IndexHNSWFlat(dimension, Config.HNSW_M)
+    index.hnsw.efConstruction = Config.HNSW_EF_CONSTRUCTION
+    return index
+
+
+def _ivfpq_params(dimension: int, num_vectors: int) -> Tuple[int, int, int]:
+    """
+    Fit the configured IVF-PQ sizes to the data.
+
+    k-means wants roughly 39 training points per centroid, and the manual only
+    has ~1.5k chunks, so the cluster and codebook counts are capped by
+    num_vectors. PQ also needs PQ_M to divide the dimension.
+
+    Args:
+        dimension: Embedding dimension
+        num_vectors: Number of training vectors
+
+    Returns:
+        Tuple of (nlist, m, nbits)
+    """
+    nlist = max(1, min(Config.IVF_NLIST, num_vectors // 39))
+    m = max(d for d in range(1, min(Config.PQ_M, dimension) + 1) if dimension % d == 0)
+    nbits = max(1, min(Config.PQ_NBITS, (num_vectors // 39).bit_length() - 1))
+    return nlist, m, nbits
+
+
+def _apply_search_params(vector_store) -> None:
+    """Apply query-time index settings (HNSW efSearch, IVF nprobe) from Config."""
+    hnsw = getattr(vector_store.index, "hnsw", None)
+    if hnsw is not None:
+        hnsw.efSearch = Config.HNSW_EF_SEARCH
+    if isinstance(vector_store.index, faiss.IndexIVF):
+        vector_store.index.nprobe = Config.IVF_NPROBE
+
+
+def _embed_texts(texts: List[str], embeddings, cache: Optional[EmbedCache]) -> List[List[float]]:
+    """Embed texts, reading/writing the embedding cache if one is given."""
+    if cache is not None:
+        return cache.get_or_compute_many(texts, Config.get_embedding_model_name(), embeddings.embed_documents)
+    return embeddings.embed_documents(texts)
+
+
+def _embed_unique(
+    chunks: Iterable[Document], embeddings, cache: Optional[EmbedCache] = None
+) -> Tuple[List[Document], List[List[float]], int]:
+    """
+    Embed chunks, sending each distinct (whitespace-trimmed) text only once.
+
+    New texts are handed to a background thread in groups of
+    EMBED_BATCH_SIZE * EMBED_CONCURRENCY (one round of concurrent requests)
+    while the chunk iterator keeps producing, so a generator's parsing and
+    splitting work overlaps the embedding round-trips.
+
+    With a cache, texts already embedded by an earlier build (same model) are
+    read from the content-addressed embedding cache instead.
+
+    Args:
+        chunks: Document chunks to embed (a list or generator)
+        embeddings: Embeddings instance
+        cache: Embedding cache to read/write, or None to always embed
+
+    Returns:
+        Tuple of (chunks as a list; one vector per chunk, in chunk order;
+        number of unique texts embedded)
+    """
+    group_size = Config.EMBED_BATCH_SIZE * max(1, Config.EMBED_CONCURRENCY)
+
+    collected = []
+    unique_index = {}  # digest → position among unique texts, in first-seen order
+    keys = []
+    pending = []
+    futures = []
+
+    # One worker: each group already fans out EMBED_CONCURRENCY requests itself
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for chunk in chunks:
+            collected.append(chunk)
+            text = chunk.page_content.strip()
+            key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            keys.append(key)
+            if key not in unique_index:
+                unique_index[key] = len(unique_index)
+                pending.append(chunk.page_content)
+                if len(pending) >= group_size:
+                    futures.append(executor.submit(_embed_texts, pending, embeddings, cache))
+                    pending = []
+        if pending:
+            futures.append(executor.submit(_embed_texts, pending, embeddings, cache))
+
+        unique_vectors = [vector for future in futures for vector in future.result()]
+
+    return collected, [unique_vectors[unique_index[key]] for key in keys], len(unique_index)
+
+
+# File names inside a saved vector store directory
+_INDEX_FILE = "index.faiss"
+_DOCSTORE_FILE = "docstore.json"
+_VECTORS_FILE = "vectors.npy"
+
+
+def get_chunk_vectors(vector_store) -> Optional[np.ndarray]:
+    """
+    Get the exact chunk embeddings of a store built or loaded by this module.
+
+    Row i is the embedding of the chunk at FAISS row i. Unlike the index, which
+    may hold only quantized codes (sq8/ivfpq) or a graph layout (hnsw), this is
+    a plain float32 matrix, memory-mapped when the store was loaded from disk.
+
+    Args:
+        vector_store: FAISS vector store
+
+    Returns:
+        (N, D) float32 matrix, or None if the store has no saved vectors
+    """
+    return getattr(vector_store, "chunk_vectors", None)
+
+
+def similarity_search_reranked(vector_store, embedding: List[float], k: int, fetch_k: int = None) -> List[Document]:
+    """
+    Retrieve fetch_k candidates from the index, then rank them by exact distance.
+
+    HNSW, SQ8 and IVF-PQ indexes trade some accuracy for speed, so their
+    top-k can be slightly off. Re-scoring a wider candidate set against the
+    exact chunk vectors (see get_chunk_vectors) recovers the true top-k at the
+    cost of fetch_k small dot products. Exact flat indexes, or stores without
+    chunk vectors, are searched directly.
+
+    Args:
+        vector_store: FAISS vector store
+        embedding: Query embedding
+        k: Number of results to return
+        fetch_k: Candidates to re-score. Defaults to Config.RERANK_FETCH_K.
+
+    Returns:
+        The k closest Document chunks, closest first
+    """
+    if fetch_k is None:
+        fetch_k = Config.RERANK_FETCH_K
+
+    chunk_vectors = get_chunk_vectors(vector_store)
+    if chunk_vectors is None or fetch_k <= k or isinstance(vector_store.index, faiss.IndexFlat):
+        return vector_store.similarity_search_by_vector(embedding, k=k)
+
+    query = np.asarray(embedding, dtype=np.float32)
+    _, rows = vector_store.index.search(query[None, :], fetch_k)
+    rows = rows[0][rows[0] >= 0]  # IVF may return fewer than fetch_k (-1 padded)
+
+    # Exact squared L2, the same metric the index approximates
+    distances = ((chunk_vectors[rows] - query) ** 2).sum(axis=1)
+    best = rows[np.argsort(distances, kind="stable")[:k]]
+
+    return [vector_store.docstore.search(vector_store.index_to_docstore_id[int(row)]) for row in best]
+
+
 def save_vector_store(vector_store, path: str = "f150_vector_store"):
     """
     Save vector store to disk for later use.
 
+    The FAISS index is written in its native format (so an IVF index's lists
+    can be memory-mapped on load) and the chunks as JSON, instead of
+    LangChain's pickle file.
+
     Args:
         vector_store: FAISS vector store to save
         path: Directory path to save to (default: f150_vector_store)
     """
-    vector_store.save_local(path)
+    os.makedirs(path, exist_ok=True)
+
+    # index_to_docstore_id maps FAISS row → docstore id; save rows in order
+    documents = []
+    for row in range(len(vector_store.index_to_docstore_id)):
+        doc_id = vector_store.index_to_docstore_id[row]
+        doc = vector_store.docstore.search(doc_id)
+        documents.append({"id": doc_id, "page_content": doc.page_content, "metadata": doc.metadata})
+
+    # Write to temp files and rename, so a store that has the old index
+    # memory-mapped keeps reading a consistent file
+    index_path = os.path.join(path, _INDEX_FILE)
+    faiss.write_index(vector_store.index, index_path + ".tmp")
+    os.replace(index_path + ".tmp", index_path)
+
+    docstore_path = os.path.join(path, _DOCSTORE_FILE)
+    with open(docstore_path + ".tmp", "w") as f:
+        json.dump(documents, f)
+    os.replace(docstore_path + ".tmp", docstore_path)
+
+    chunk_vectors = get_chunk_vectors(vector_store)
+    if chunk_vectors is not None:
+        vectors_path = os.path.join(path, _VECTORS_FILE)
+        with open(vectors_path + ".tmp", "wb") as f:
+            np.save(f, chunk_vectors)
+        os.replace(vectors_path + ".tmp", vectors_path)
+
     print(f"✓ Vector store saved to {path}")
 
 
@@ -78,22 +335,129 @@ def load_vector_store(path: str = "f150_vector_store"):
     """
     Load a previously saved vector store from disk.
 
+    The exact vectors (see get_chunk_vectors) are memory-mapped read-only, so
+    they are paged in by the OS as re-ranking touches them rather than read up
+    front. The index is read with IO_FLAG_MMAP, but FAISS only maps the
+    inverted lists of IVF indexes (ivfpq) that way; flat, HNSW and sq8 indexes
+    are read fully into memory. The chunks are plain JSON, so loading never
+    unpickles anything.
+
     Args:
         path: Directory path to load from
 
     Returns:
         Loaded FAISS vector store
     """
-    embeddings = create_embeddings()
-    vector_store = FAISS.load_local(
-        path,
-        embeddings,
-        allow_dangerous_deserialization=True  # We trust our own data
+    # Maps IVF inverted lists only; other index types ignore the flag
+    index = faiss.read_index(os.path.join(path, _INDEX_FILE), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+
+    with open(os.path.join(path, _DOCSTORE_FILE)) as f:
+        documents = json.load(f)
+
+    vector_store = FAISS(
+        embedding_function=create_embeddings(),
+        index=index,
+        docstore=InMemoryDocstore({
+            doc["id"]: Document(id=doc["id"], page_content=doc["page_content"], metadata=doc["metadata"])
+            for doc in documents
+        }),
+        index_to_docstore_id={row: doc["id"] for row, doc in enumerate(documents)},
     )
+    vectors_path = os.path.join(path, _VECTORS_FILE)
+    if os.path.exists(vectors_path):
+        vector_store.chunk_vectors = np.load(vectors_path, mmap_mode="r")
+    _apply_search_params(vector_store)
     print(f"✓ Vector store loaded from {path}")
     return vector_store
 
 
+def _file_sha256(path: str) -> str:
+    """Hash a file in 1MB blocks so the whole PDF is never held in memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_cache_path(pdf_path: str = None) -> str:
+    """
+    Get the on-disk cache directory for a PDF's vector store.
+
+    The directory name combines the PDF's SHA-256 with the embedding model,
+    so editing the PDF or switching models lands on a fresh cache entry.
+
+    Args:
+        pdf_path: Path to PDF file. Defaults to F150 manual path from config.
+
+    Returns:
+        Directory path for the cached FAISS index
+    """
+    if pdf_path is None:
+        pdf_path = Config.F150_MANUAL_PATH
+
+    model_slug = Config.get_embedding_model_name().replace("/", "_").replace(":", "_")
+    return os.path.join(Config.CACHE_DIR, f"{_file_sha256(pdf_path)}-{model_slug}")
+
+
+def load_or_create_vector_store(pdf_path: str = None):
+    """
+    Load the vector store from the on-disk cache, building it on a miss.
+
+    The first run pays the full load → chunk → embed cost and saves the
+    result; every later run with the same PDF and embedding model loads
+    the saved index instead (sub-second vs 15-30 seconds).
+
+    A sidecar meta.json records the embedding model, PDF parser, chunking and index settings.
+    If they don't match the current configuration the cache is treated as stale.
+
+    Args:
+        pdf_path: Path to PDF file. Defaults to F150 manual path from config.
+
+    Returns:
+        FAISS vector store with indexed chunks
+    """
+    if pdf_path is None:
+        pdf_path = Config.F150_MANUAL_PATH
+
+    cache_path = get_cache_path(pdf_path)
+    meta_path = os.path.join(cache_path, "meta.json")
+
+    expected_meta = {
+        "embedding_model": Config.get_embedding_model_name(),
+        "pdf_parser": PDF_PARSER,
+        "chunk_size": Config.CHUNK_SIZE,
+        "chunk_overlap": Config.CHUNK_OVERLAP,
+        "chunk_size_tokens": Config.CHUNK_SIZE_TOKENS,
+        "index_type": Config.FAISS_INDEX_TYPE,
+    }
+    if Config.FAISS_INDEX_TYPE == "hnsw":
+        expected_meta["hnsw_m"] = Config.HNSW_M
+        expected_meta["hnsw_ef_construction"] = Config.HNSW_EF_CONSTRUCTION
+    elif Config.FAISS_INDEX_TYPE == "ivfpq":
+        expected_meta["ivf_nlist"] = Config.IVF_NLIST
+        expected_meta["pq_m"] = Config.PQ_M
+        expected_meta["pq_nbits"] = Config.PQ_NBITS
+
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if all(meta.get(key) == value for key, value in expected_meta.items()):
+            try:
+                return load_vector_store(cache_path)
+            except Exception as e:
+                print(f"⚠ Cached vector store unreadable ({e}), rebuilding...")
+
+    print(f"Loading, chunking and embedding PDF: {pdf_path}")
+    vector_store = create_vector_store(iter_pdf_chunks(pdf_path))
+
+    save_vector_store(vector_store, cache_path)
+    with open(meta_path, "w") as f:
+        json.dump({**expected_meta, "pdf_path": pdf_path}, f, indent=2)
+
+    return vector_store
+
+
 def test_vector_store(vector_store):
     """
     Test the vector store with sample queries.
@@ -5,8 +5,13 @@ This tool enables the agent to search the manual using semantic similarity,
 finding relevant information even when exact keywords don't match.
 """
 
+from collections import OrderedDict
 from langchain.tools import tool
-from typing import TYPE_CHECKING
+from langchain_core.documents import Document
+from typing import TYPE_CHECKING, List
+from ..cache.query_vectors import recall_query_vector
+from ..config import Config
+from ..utils.telemetry import get_telemetry_logger
 
 if TYPE_CHECKING:
     from langchain_community.vectorstores import FAISS
@@ -15,18 +20,69 @@ if TYPE_CHECKING:
 # This is set when the agent is created
 _vector_store = None
 
+# (id of vector store, question, k) → results, least recently used first
+_SEARCH_CACHE_SIZE = 256
+_search_cache: "OrderedDict[tuple, List[Document]]" = OrderedDict()
+
 
 def set_vector_store(vector_store: "FAISS"):
     """
     Set the global vector store for the manual search tool.
 
-    This must be called before the tool can be used.
+    This must be called before the tool can be used. Calling it again with
+    the store that is already set (e.g. on every agent/graph rebuild) is a no-op.
 
     Args:
         vector_store: FAISS vector store with indexed F150 manual chunks
     """
     global _vector_store
+    if vector_store is _vector_store:
+        return
     _vector_store = vector_store
+    _search_cache.clear()
+
+
+def similarity_search(vector_store: "FAISS", question: str, k: int) -> List[Document]:
+    """
+    Search the vector store, reusing a cached result or embedding when possible.
+
+    Repeated (question, k) searches on the same store are answered from an
+    LRU cache without embedding or searching again. Approximate indexes are
+    re-ranked by exact distance (see similarity_search_reranked).
+
+    If the question is exactly the user's message, its vector from the
+    semantic cache lookup is reused (see src.cache.query_vectors), saving one
+    embedding round-trip. Only the chain entry point searches with the user's
+    own text; the graph's RAG node searches with a reformulated query, so it
+    is embedded here as usual.
+
+    Args:
+        vector_store: FAISS vector store to search
+        question: The text to search for
+        k: Number of results to return
+
+    Returns:
+        The k most similar Document chunks
+    """
+    key = (id(vector_store), question.strip(), k)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        _search_cache.move_to_end(key)
+        return list(cached)
+
+    from ..rag.vector_store import similarity_search_reranked
+
+    embedding = recall_query_vector(question)
+    if embedding is None:
+        embedding = vector_store.embeddings.embed_query(question)
+    else:
+        embedding = embedding.tolist()
+    results = similarity_search_reranked(vector_store, embedding, k=k)
+
+    _search_cache[key] = results
+    if len(_search_cache) > _SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+    return list(results)
 
 
 @tool
@@ -54,13 +110,14 @@ def search_f150_manual(question: str) -> str:
         "According to the manual, fuse 33 (15A) is for..."
     """
 
-    print("\n🔍 Searching F-150 manual...")
+    if Config.TELEMETRY:
+        get_telemetry_logger().info("\n🔍 Searching F-150 manual...")
 
     if _vector_store is None:
         return "Error: Manual not loaded. Please restart the application."
 
     # Search for relevant chunks (top 5 most similar)
-    results = _vector_store.similarity_search(question, k=5)
+    results = similarity_search(_vector_store, question, k=5)
 
     if not results:
         return "No relevant information found in the manual for this question."
@@ -2,6 +2,22 @@ import random
 from langchain.tools import tool
 
 
+# Fake weather data - simulates OpenWeatherMap API response
+_WEATHER_CONDITIONS = (
+    "clear sky",
+    "few clouds",
+    "scattered clouds",
+    "broken clouds",
+    "light rain",
+    "moderate rain",
+    "overcast clouds",
+    "mist",
+    "partly cloudy",
+)
+
+_rng = random.Random()
+
+
 @tool
 def get_weather(location: str) -> str:
     """
@@ -13,24 +29,11 @@ def get_weather(location: str) -> str:
     Returns:
         A string describing the current weather conditions
     """
-    # Fake weather data - simulates OpenWeatherMap API response
-    weather_conditions = [
-        "clear sky",
-        "few clouds",
-        "scattered clouds",
-        "broken clouds",
-        "light rain",
-        "moderate rain",
-        "overcast clouds",
-        "mist",
-        "partly cloudy"
-    ]
-
     # Generate realistic fake data
-    temp = random.randint(45, 85)
-    feels_like = temp + random.randint(-5, 5)
-    humidity = random.randint(30, 90)
-    description = random.choice(weather_conditions)
+    temp = _rng.randint(45, 85)
+    feels_like = temp + _rng.randint(-5, 5)
+    humidity = _rng.randint(30, 90)
+    description = _rng.choice(_WEATHER_CONDITIONS)
 
     # Clean up the location name for display
     city_name = location.split(',')[0].strip().title()
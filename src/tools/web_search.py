@@ -5,13 +5,16 @@ This tool enables agents to search the web for current information,
 troubleshooting tips, and real-world knowledge not found in static documents.
 """
 
+from functools import lru_cache
 from langchain.tools import tool
 from langchain_community.tools import BraveSearch
 from ..config import Config
+from ..utils.telemetry import get_telemetry_logger
 
 
+@lru_cache(maxsize=1)
 def _get_brave_search():
-    """Create and configure Brave Search tool."""
+    """Create and configure Brave Search tool (once per process; a missing key is not cached)."""
     if not Config.BRAVE_API_KEY:
         raise ValueError("BRAVE_API_KEY not found in environment variables")
 
@@ -45,7 +48,8 @@ def search_web(query: str) -> str:
         "Web search results for 'frozen door latch problem'..."
     """
 
-    print(f"\n🌐 Searching web for: '{query}'...")
+    if Config.TELEMETRY:
+        get_telemetry_logger().info("\n🌐 Searching web for: '%s'...", query)
 
     try:
         brave_search = _get_brave_search()
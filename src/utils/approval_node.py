@@ -10,6 +10,7 @@ from langgraph.types import interrupt
 from langchain_core.messages import AIMessage
 from src.graph.state import F150StateWithDualContext
 from src.config import Config
+from src.utils.telemetry import get_telemetry_logger
 
 
 def create_approval_node(enabled: bool = True):
@@ -30,6 +31,7 @@ def create_approval_node(enabled: bool = True):
     Usage:
         >>> workflow.add_node("approval_gate", create_approval_node(enabled=True))
     """
+    logger = get_telemetry_logger() if Config.TELEMETRY else None
 
     def approval_node(state: F150StateWithDualContext) -> Dict:
         """
@@ -51,9 +53,6 @@ def create_approval_node(enabled: bool = True):
         if not enabled:
             return {}
 
-        if Config.TELEMETRY:
-            print("\n✋ APPROVAL_GATE: Requesting human approval for tool execution...")
-
         messages = state["messages"]
         last_message = messages[-1]
 
@@ -64,9 +63,12 @@ def create_approval_node(enabled: bool = True):
 
         # Build approval prompt with tool details
         tool_calls = last_message.tool_calls
-        if Config.TELEMETRY:
-            tool_names = [tc.get('name') for tc in tool_calls]
-            print(f"  Tools requested: {tool_names}")
+        if logger:
+            logger.info(
+                "\n✋ APPROVAL_GATE: Requesting human approval for tool execution...\n"
+                "  Tools requested: %s",
+                [tc.get('name') for tc in tool_calls]
+            )
 
         approval_prompt = _build_approval_prompt(tool_calls)
 
@@ -78,8 +80,8 @@ def create_approval_node(enabled: bool = True):
         # Handle the approval decision
         if approval_decision is False or (isinstance(approval_decision, dict) and approval_decision.get("approved") is False):
             # Tools rejected - inject message telling agent to respond without tools
-            if Config.TELEMETRY:
-                print("  ✗ Tools rejected - agent will respond without tools")
+            if logger:
+                logger.info("  ✗ Tools rejected - agent will respond without tools")
             rejection_message = AIMessage(
                 content="[SYSTEM: The requested tool calls were not approved. Please respond to the user's question directly without using tools.]",
                 tool_calls=[]  # Clear tool calls
@@ -87,8 +89,8 @@ def create_approval_node(enabled: bool = True):
             return {"messages": [rejection_message]}
 
         # Tools approved - continue to tool execution
-        if Config.TELEMETRY:
-            print("  ✓ Tools approved - proceeding to execution")
+        if logger:
+            logger.info("  ✓ Tools approved - proceeding to execution")
         return {}
 
     return approval_node
@@ -120,6 +122,10 @@ def _build_approval_prompt(tool_calls: list) -> Dict:
     }
 
 
+_CLI_RULE = "\n" + "=" * 70
+_CLI_HEADER = f"{_CLI_RULE}\nTOOL APPROVAL REQUEST\n{'=' * 70}"
+
+
 def format_approval_prompt_for_cli(interrupt_data: Dict) -> str:
     """
     Format the interrupt data into a CLI-friendly prompt.
@@ -141,24 +147,17 @@ def format_approval_prompt_for_cli(interrupt_data: Dict) -> str:
         return str(interrupt_data)
 
     tools = interrupt_data.get("tools", [])
-    lines = [
-        "\n" + "=" * 70,
-        "TOOL APPROVAL REQUEST",
-        "=" * 70,
-    ]
+    parts = [_CLI_HEADER]
 
     for i, tool in enumerate(tools, 1):
-        lines.append(f"\n[{i}] Tool: {tool.get('name', 'unknown')}")
-        lines.append(f"    Arguments:")
-        args = tool.get('args', {})
-        for key, value in args.items():
+        parts.append(f"\n\n[{i}] Tool: {tool.get('name', 'unknown')}\n    Arguments:")
+        for key, value in tool.get('args', {}).items():
             # Truncate long values for display
             value_str = str(value)
             if len(value_str) > 100:
                 value_str = value_str[:100] + "..."
-            lines.append(f"      {key}: {value_str}")
+            parts.append(f"\n      {key}: {value_str}")
 
-    lines.append("\n" + "=" * 70)
-    lines.append(f"Approve execution of these {len(tools)} tool(s)? (y/n): ")
+    parts.append(f"\n{_CLI_RULE}\nApprove execution of these {len(tools)} tool(s)? (y/n): ")
 
-    return "\n".join(lines)
+    return "".join(parts)
@@ -0,0 +1,43 @@
+"""
+Line editing and persistent history for the interactive CLIs.
+
+Importing readline is enough to give input() arrow-key editing and history.
+History is saved to Config.CACHE_DIR so previous questions can be recalled
+with the up arrow after a restart.
+"""
+
+import atexit
+import os
+
+from src.config import Config
+
+
+HISTORY_LENGTH = 1000
+
+
+def enable_input_history(name: str = "history"):
+    """
+    Enable readline editing/history for input() and persist it across runs.
+
+    Does nothing on platforms without readline (e.g. plain Windows Python).
+
+    Args:
+        name: History file name inside Config.CACHE_DIR (one per entry point)
+    """
+    try:
+        import readline
+    except ImportError:  # readline is not available on every platform
+        return
+
+    history_path = os.path.join(Config.CACHE_DIR, name)
+    try:
+        readline.read_history_file(history_path)
+    except (FileNotFoundError, OSError):
+        pass
+    readline.set_history_length(HISTORY_LENGTH)
+
+    def _save_history():
+        os.makedirs(Config.CACHE_DIR, exist_ok=True)
+        readline.write_history_file(history_path)
+
+    atexit.register(_save_history)
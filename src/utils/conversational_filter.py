@@ -6,11 +6,74 @@ This module provides utilities to detect and handle purely conversational messag
 and reducing unnecessary tool calls.
 """
 
-import re
-from typing import Dict
+import string
+from typing import Dict, Optional
 from langgraph.graph import MessagesState
 from langchain_core.messages import AIMessage, HumanMessage
+from src.cache.query_vectors import forget_query_vector
 from src.config import Config
+from src.utils.telemetry import get_telemetry_logger
+
+
+# Single table of conversational vocabulary: (category, phrases, canned response).
+# Conversational-only messages are one of the phrases, optionally followed by
+# spaces/!/. - so a set lookup after stripping the suffix is enough. Phrases
+# are grouped by the response they get.
+_CATEGORIES = (
+    ("thanks", ("thank you", "thanks", "thank u"),
+     "You're welcome! Let me know if you have any other questions about your F-150!"),
+    ("praise", ("great",),
+     "Glad I could help! Feel free to ask anything else about your 2018 F-150."),
+    ("ok", ("ok", "okay"),
+     "Great! Let me know if there's anything else I can help with."),
+    ("greeting", ("hi", "hello"),
+     "Hello! How can I help you with your 2018 F-150 today?"),
+    ("hey", ("hey",),
+     "Hey there! What can I help you with regarding your F-150?"),
+    ("farewell", ("bye", "goodbye"),
+     "Goodbye! Come back anytime you have F-150 questions!"),
+    ("yes", ("yes",),
+     "Got it! Anything else you'd like to know?"),
+    ("no", ("no", "nope"),
+     "No problem! Let me know if you need anything."),
+    ("other", (
+        "sup", "yo", "howdy",
+        "thx", "ty", "tysm", "appreciate it",
+        "got it", "cool", "nice", "perfect", "awesome", "excellent",
+        "see you", "later", "cya", "take care",
+        "yeah", "yep", "yup", "sure", "alright", "nah",
+    ), "You're welcome! Feel free to ask if you have any questions about your 2018 F-150."),
+)
+
+_RESPONSE_BY_CATEGORY = {category: response for category, _, response in _CATEGORIES}
+_CATEGORY_BY_PHRASE = {phrase: category for category, phrases, _ in _CATEGORIES for phrase in phrases}
+_CONVERSATIONAL_PHRASES = frozenset(_CATEGORY_BY_PHRASE)
+
+# "<acknowledgment> <thanks>", e.g. "great thanks" (any whitespace, or none, between)
+_ACK_BEFORE_THANKS = ("great", "ok", "okay", "cool", "nice", "perfect", "awesome")
+_THANKS = frozenset({"thank you", "thanks", "thx"})
+
+_TRAILING_CHARS = string.whitespace + "!."
+
+# First characters (either case) of the phrases above; anything else is a domain
+# question, rejected without lowercasing the whole message
+_CONVERSATIONAL_STARTS = frozenset(
+    char for phrase in _CONVERSATIONAL_PHRASES for char in (phrase[0], phrase[0].upper())
+)
+
+# Category by keyword for other text, checked in order (first keyword found wins)
+_KEYWORD_CATEGORIES = (
+    ('thank', "thanks"),
+    ('great', "praise"),
+    ('ok', "ok"),
+    ('hi', "greeting"),
+    ('hello', "greeting"),
+    ('hey', "hey"),
+    ('bye', "farewell"),
+    ('yes', "yes"),
+    ('no', "no"),
+)
+_DEFAULT_CATEGORY = "other"
 
 
 def _extract_text_content(content) -> str:
@@ -41,11 +104,46 @@ def _extract_text_content(content) -> str:
     return str(content)
 
 
+def match_conversational_category(text) -> Optional[str]:
+    """
+    Find the category of a purely conversational message, if it is one.
+
+    Args:
+        text: The user's message text (string or list of content blocks)
+
+    Returns:
+        The category of the matched phrase (see _CATEGORIES), or None for any
+        other message
+
+    Examples:
+        >>> match_conversational_category("Thanks!")
+        'thanks'
+        >>> match_conversational_category("What is the oil capacity?") is None
+        True
+    """
+    text_str = _extract_text_content(text).strip()
+    if not text_str or text_str[0] not in _CONVERSATIONAL_STARTS:
+        return None
+
+    phrase = text_str.lower().rstrip(_TRAILING_CHARS)
+    category = _CATEGORY_BY_PHRASE.get(phrase)
+    if category is not None:
+        return category
+
+    for ack in _ACK_BEFORE_THANKS:
+        if phrase.startswith(ack):
+            thanks = phrase[len(ack):].lstrip()
+            if thanks in _THANKS:
+                return _ACK_THANKS_CATEGORIES[ack, thanks]
+
+    return None
+
+
 def is_conversational_only(text) -> bool:
     """
     Detect if a message is purely conversational (no domain-specific question).
 
-    This function uses regex patterns to identify common conversational phrases
+    This function looks the message up in a fixed set of conversational phrases
     that don't require tool usage or complex LLM reasoning.
 
     Args:
@@ -62,36 +160,7 @@ def is_conversational_only(text) -> bool:
         >>> is_conversational_only("Great!")
         True
     """
-    text_str = _extract_text_content(text)
-    text_lower = text_str.lower().strip()
-
-    # Patterns for conversational-only messages
-    conversational_patterns = [
-        # Greetings
-        r'^(hi|hello|hey|sup|yo|howdy)[\s!.]*$',
-
-        # Thanks
-        r'^(thank you|thanks|thx|ty|thank u|tysm|appreciate it)[\s!.]*$',
-
-        # Acknowledgments
-        r'^(great|ok|okay|got it|cool|nice|perfect|awesome|excellent)[\s!.]*$',
-
-        # Combined acknowledgment + thanks
-        r'^(great|ok|okay|cool|nice|perfect|awesome)\s*(thank you|thanks|thx)[\s!.]*$',
-
-        # Farewells
-        r'^(bye|goodbye|see you|later|cya|take care)[\s!.]*$',
-
-        # Affirmations
-        r'^(yes|yeah|yep|yup|sure|alright)[\s!.]*$',
-        r'^(no|nope|nah)[\s!.]*$',
-    ]
-
-    for pattern in conversational_patterns:
-        if re.match(pattern, text_lower):
-            return True
-
-    return False
+    return match_conversational_category(text) is not None
 
 
 def get_conversational_response(text) -> str:
@@ -104,40 +173,44 @@ def get_conversational_response(text) -> str:
     Returns:
         An appropriate response string
     """
-    text_str = _extract_text_content(text)
-    text_lower = text_str.lower().strip()
-
-    # Response mapping based on message type
-    response_map = {
-        'thank': "You're welcome! Let me know if you have any other questions about your F-150!",
-        'great': "Glad I could help! Feel free to ask anything else about your 2018 F-150.",
-        'ok': "Great! Let me know if there's anything else I can help with.",
-        'hi': "Hello! How can I help you with your 2018 F-150 today?",
-        'hello': "Hello! How can I help you with your 2018 F-150 today?",
-        'hey': "Hey there! What can I help you with regarding your F-150?",
-        'bye': "Goodbye! Come back anytime you have F-150 questions!",
-        'yes': "Got it! Anything else you'd like to know?",
-        'no': "No problem! Let me know if you need anything.",
-    }
-
-    # Find matching keyword and return response
-    for keyword, response in response_map.items():
+    category = match_conversational_category(text)
+    if category is None:
+        category = _keyword_category(_extract_text_content(text).lower().strip())
+    return _RESPONSE_BY_CATEGORY[category]
+
+
+def _keyword_category(text_lower: str) -> str:
+    """Return the category of the first keyword (in priority order) found in the text."""
+    for keyword, category in _KEYWORD_CATEGORIES:
         if keyword in text_lower:
-            return response
+            return category
 
-    # Default fallback response
-    return "You're welcome! Feel free to ask if you have any questions about your 2018 F-150."
+    # Default fallback category
+    return _DEFAULT_CATEGORY
 
 
-def create_conversational_filter_node(domain_name: str = "F-150"):
+# Category of every "<acknowledgment> <thanks>" pair, resolved once
+_ACK_THANKS_CATEGORIES = {
+    (ack, thanks): _keyword_category(f"{ack} {thanks}") for ack in _ACK_BEFORE_THANKS for thanks in _THANKS
+}
+
+
+def create_conversational_filter_node(domain_name: str = "F-150", semantic_cache=None):
     """
     Factory function to create a pre-filter node for conversational messages.
 
     This node intercepts purely conversational messages and returns canned responses
     without invoking the LLM with tools, reducing latency and token usage.
 
+    With a semantic_cache, domain questions are also looked up there, and a
+    close enough earlier question is answered from the cache (also bypassing
+    the agent). On a miss the question's embedding stays remembered for the
+    turn (see src.cache.query_vectors), so the manual search and the cache
+    store step reuse it without embedding it again.
+
     Args:
         domain_name: The domain/topic name to use in responses (e.g., "F-150")
+        semantic_cache: Optional SemanticCache of previous answers
 
     Returns:
         A node function that can be added to a LangGraph workflow
@@ -145,6 +218,17 @@ def create_conversational_filter_node(domain_name: str = "F-150"):
     Usage:
         >>> workflow.add_node("pre_filter", create_conversational_filter_node("F-150"))
     """
+    # Read once per node build; the flag does not change at runtime
+    logger = get_telemetry_logger() if Config.TELEMETRY else None
+
+    # Canned responses customized with the domain name, built once per node
+    domain_responses = {}
+    if domain_name and domain_name != "F-150":
+        domain_responses = {
+            response: response.replace("F-150", domain_name).replace("2018 F-150", domain_name)
+            for response in _RESPONSE_BY_CATEGORY.values()
+        }
+
     def pre_filter_node(state: MessagesState) -> Dict:
         """
         Pre-filter node that checks if the message is conversational-only.
@@ -158,36 +242,50 @@ def create_conversational_filter_node(domain_name: str = "F-150"):
         Returns:
             Dict with messages and bypass_agent flag
         """
-        if Config.TELEMETRY:
-            print("\n🔍 PRE_FILTER: Checking if message is conversational...")
+        if logger:
+            logger.info("\n🔍 PRE_FILTER: Checking if message is conversational...")
 
         messages = state["messages"]
 
-        # Get the last user message
-        last_user_message = None
-        for msg in reversed(messages):
-            if isinstance(msg, HumanMessage):
-                last_user_message = msg
-                break
-
-        # Check if it's conversational-only
-        if last_user_message and is_conversational_only(last_user_message.content):
-            if Config.TELEMETRY:
-                print("  ✓ Conversational message detected - bypassing agent")
-            response_text = get_conversational_response(last_user_message.content)
-
-            # Customize response with domain name
-            if domain_name and domain_name != "F-150":
-                response_text = response_text.replace("F-150", domain_name).replace("2018 F-150", domain_name)
+        # Get the last user message (normally the newest message, so check it first)
+        last_user_message = messages[-1] if messages else None
+        if not isinstance(last_user_message, HumanMessage):
+            last_user_message = None
+            for msg in reversed(messages):
+                if isinstance(msg, HumanMessage):
+                    last_user_message = msg
+                    break
+
+        # Check if it's conversational-only (the matched category picks the response)
+        category = match_conversational_category(last_user_message.content) if last_user_message else None
+        if category is not None:
+            if logger:
+                logger.info("  ✓ Conversational message detected - bypassing agent")
+            response_text = _RESPONSE_BY_CATEGORY[category]
+            response_text = domain_responses.get(response_text, response_text)
 
             return {
                 "messages": [AIMessage(content=response_text)],
                 "bypass_agent": True
             }
 
+        if last_user_message and semantic_cache is not None:
+            text = _extract_text_content(last_user_message.content)
+            query_vector = semantic_cache.embed_message(text)
+            cached_answer = semantic_cache.lookup(query_vector)
+            if cached_answer:
+                # Answered here, so nothing later in the turn needs the vector
+                forget_query_vector(text)
+                if logger:
+                    logger.info("  ✓ Semantic cache hit - bypassing agent")
+                return {
+                    "messages": [AIMessage(content=cached_answer)],
+                    "bypass_agent": True
+                }
+
         # Not conversational-only, proceed to agent
-        if Config.TELEMETRY:
-            print("  ✓ Domain question detected - proceeding to agent")
+        if logger:
+            logger.info("  ✓ Domain question detected - proceeding to agent")
         return {"bypass_agent": False}
 
     return pre_filter_node
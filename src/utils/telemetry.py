@@ -0,0 +1,58 @@
+"""
+Buffered telemetry output for graph nodes.
+
+Nodes log through a QueueHandler, so a log call only enqueues a record. A
+background QueueListener thread formats it and writes it to stdout, which
+keeps terminal I/O off the agent's critical path. Records appear in order
+relative to each other, as plain lines, the same way print() telemetry did.
+
+The writer thread does not know about the CLI's own output (streamed tokens,
+prompts), so the CLI calls flush_telemetry() before writing to stdout;
+otherwise a pending record could land in the middle of an answer or prompt.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+_LOGGER_NAME = "f150.telemetry"
+_listener = None
+_records = None
+
+
+def get_telemetry_logger() -> logging.Logger:
+    """
+    Get the shared telemetry logger, starting its background writer on first use.
+
+    Returns:
+        Logger whose records are written to stdout by a background thread
+    """
+    global _listener, _records
+    logger = logging.getLogger(_LOGGER_NAME)
+
+    if _listener is None:
+        # A Queue (not SimpleQueue) so flush_telemetry() can join() it
+        _records = queue.Queue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        _listener = QueueListener(_records, stream_handler)
+        _listener.start()
+        # Stopping the listener drains the queue, so nothing is lost on exit
+        atexit.register(_listener.stop)
+
+        logger.addHandler(QueueHandler(_records))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    return logger
+
+
+def flush_telemetry() -> None:
+    """Block until every record logged so far has been written to stdout."""
+    if _records is not None:
+        _records.join()
+        sys.stdout.flush()
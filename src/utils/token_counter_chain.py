@@ -1,26 +1,102 @@
 """Token counting utilities for tracking context usage with Ollama."""
 
-from typing import Dict, Any, List, Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union
+import numpy as np
 from langchain_core.messages import BaseMessage
 
 
+# Rows preallocated for the interaction history (doubled when full)
+_HISTORY_INITIAL_ROWS = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Interaction:
+    """
+    Token usage of one tracked interaction.
+
+    Derived figures are properties, computed only when read. Item access
+    (stats['usage_percentage']) is supported so callers that treated the
+    usage statistics as a dict keep working.
+    """
+
+    prompt_tokens: int
+    completion_tokens: int
+    cumulative_prompt_tokens: int
+    cumulative_completion_tokens: int
+    context_limit: int
+
+    @property
+    def interaction_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cumulative_tokens(self) -> int:
+        return self.cumulative_prompt_tokens + self.cumulative_completion_tokens
+
+    @property
+    def usage_percentage(self) -> float:
+        return (self.cumulative_tokens / self.context_limit) * 100
+
+    @property
+    def remaining_tokens(self) -> int:
+        return self.context_limit - self.cumulative_tokens
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+@dataclass(slots=True, eq=False)
 class OllamaTokenCounter:
-    """Utility class for tracking token usage from Ollama responses."""
+    """
+    Utility class for tracking token usage from Ollama responses.
 
-    def __init__(self, context_limit: int = 128000):
-        """
-        Initialize the Ollama token counter.
+    Args:
+        context_limit: Maximum context window size in tokens (default: 128k for llama3.2)
+        keep_history: Record every interaction for message_history (default: off,
+                      only the number of interactions is counted)
+    """
 
-        Args:
-            context_limit: Maximum context window size in tokens (default: 128k for llama3.2)
+    context_limit: int = 128000
+    keep_history: bool = False
+    total_tokens: int = field(default=0, init=False)
+    total_prompt_tokens: int = field(default=0, init=False)
+    total_completion_tokens: int = field(default=0, init=False)
+    _interaction_count: int = field(default=0, init=False, repr=False)
+    # One (prompt_tokens, completion_tokens) row per interaction, with keep_history only
+    _history: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.keep_history:
+            self._history = np.zeros((_HISTORY_INITIAL_ROWS, 2), dtype=np.int64)
+
+    @property
+    def message_history(self) -> List[Interaction]:
         """
-        self.context_limit = context_limit
-        self.total_tokens = 0
-        self.total_prompt_tokens = 0
-        self.total_completion_tokens = 0
-        self.message_history: List[Dict[str, Any]] = []
+        Usage statistics of every tracked interaction, oldest first.
 
-    def extract_token_counts(self, message: BaseMessage) -> Optional[Dict[str, int]]:
+        Built on access from the compact history array (equal to what
+        track_interaction returned). Empty unless the counter was created
+        with keep_history=True.
+        """
+        if self._history is None:
+            return []
+
+        history = self._history[:self._interaction_count]
+        cumulative = np.cumsum(history, axis=0)
+        return [
+            Interaction(prompt, completion, cumulative_prompt, cumulative_completion, self.context_limit)
+            for (prompt, completion), (cumulative_prompt, cumulative_completion)
+            in zip(history.tolist(), cumulative.tolist())
+        ]
+
+    @staticmethod
+    def extract_token_counts(message: BaseMessage) -> Optional[Dict[str, int]]:
         """
         Extract token counts from an Ollama response message.
 
@@ -30,11 +106,10 @@ class OllamaTokenCounter:
         Returns:
             Dictionary with token counts if available, None otherwise
         """
-        if not hasattr(message, 'response_metadata'):
+        metadata = getattr(message, 'response_metadata', None)
+        if not metadata:
             return None
 
-        metadata = message.response_metadata
-
         # Ollama returns prompt_eval_count and eval_count
         prompt_tokens = metadata.get('prompt_eval_count')
         completion_tokens = metadata.get('eval_count')
@@ -52,7 +127,7 @@ class OllamaTokenCounter:
         self,
         prompt_tokens: int,
         completion_tokens: int
-    ) -> Dict[str, Any]:
+    ) -> Interaction:
         """
         Track a single interaction and update cumulative token count.
 
@@ -61,28 +136,23 @@ class OllamaTokenCounter:
             completion_tokens: Number of tokens in the completion (from Ollama)
 
         Returns:
-            Dictionary with token usage statistics
+            Interaction with token usage statistics
         """
-        interaction_tokens = prompt_tokens + completion_tokens
-
         self.total_prompt_tokens += prompt_tokens
         self.total_completion_tokens += completion_tokens
-        self.total_tokens += interaction_tokens
-
-        usage_stats = {
-            'prompt_tokens': prompt_tokens,
-            'completion_tokens': completion_tokens,
-            'interaction_tokens': interaction_tokens,
-            'cumulative_prompt_tokens': self.total_prompt_tokens,
-            'cumulative_completion_tokens': self.total_completion_tokens,
-            'cumulative_tokens': self.total_tokens,
-            'context_limit': self.context_limit,
-            'usage_percentage': (self.total_tokens / self.context_limit) * 100,
-            'remaining_tokens': self.context_limit - self.total_tokens
-        }
-
-        self.message_history.append(usage_stats)
-        return usage_stats
+        self.total_tokens += prompt_tokens + completion_tokens
+
+        if self._history is not None:
+            if self._interaction_count == len(self._history):
+                grown = np.zeros((2 * len(self._history), 2), dtype=np.int64)
+                grown[:self._interaction_count] = self._history
+                self._history = grown
+            self._history[self._interaction_count] = (prompt_tokens, completion_tokens)
+        self._interaction_count += 1
+
+        return Interaction(
+            prompt_tokens, completion_tokens, self.total_prompt_tokens, self.total_completion_tokens, self.context_limit
+        )
 
     def get_context_percentage(self) -> float:
         """
@@ -119,7 +189,7 @@ class OllamaTokenCounter:
         self.total_tokens = 0
         self.total_prompt_tokens = 0
         self.total_completion_tokens = 0
-        self.message_history = []
+        self._interaction_count = 0
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -128,24 +198,30 @@ class OllamaTokenCounter:
         Returns:
             Dictionary with usage summary statistics
         """
+        # Same figures as get_context_percentage / get_remaining_tokens /
+        # is_near_limit, with the ratio computed once
+        total_tokens = self.total_tokens
+        context_limit = self.context_limit
+        usage_percentage = (total_tokens / context_limit) * 100
+
         return {
-            'total_tokens': self.total_tokens,
+            'total_tokens': total_tokens,
             'total_prompt_tokens': self.total_prompt_tokens,
             'total_completion_tokens': self.total_completion_tokens,
-            'context_limit': self.context_limit,
-            'usage_percentage': self.get_context_percentage(),
-            'remaining_tokens': self.get_remaining_tokens(),
-            'total_interactions': len(self.message_history),
-            'is_near_limit': self.is_near_limit()
+            'context_limit': context_limit,
+            'usage_percentage': usage_percentage,
+            'remaining_tokens': max(0, context_limit - total_tokens),
+            'total_interactions': self._interaction_count,
+            'is_near_limit': usage_percentage >= 80.0
         }
 
 
-def format_token_usage(usage_stats: Dict[str, Any], show_details: bool = True) -> str:
+def format_token_usage(usage_stats: Union[Interaction, Dict[str, Any]], show_details: bool = True) -> str:
     """
     Format token usage statistics for display.
 
     Args:
-        usage_stats: Dictionary containing token usage statistics
+        usage_stats: Interaction (or dict) with token usage statistics
         show_details: Whether to show detailed breakdown (default: True)
 
     Returns:
@@ -164,6 +240,17 @@ def format_token_usage(usage_stats: Dict[str, Any], show_details: bool = True) -
     return "\n".join(lines)
 
 
+# Usage level labels: below 50% LOW, below 80% MEDIUM, otherwise HIGH
+_LEVEL_THRESHOLDS = (50, 80)
+_LEVEL_LABELS = ('LOW', 'MEDIUM', 'HIGH')
+
+
+@lru_cache(maxsize=128)
+def _render_bar(filled: int, width: int) -> str:
+    """Bar body with filled of width cells set (only width + 1 distinct bars per width)."""
+    return '█' * filled + '-' * (width - filled)
+
+
 def get_progress_bar(percentage: float, width: int = 40) -> str:
     """
     Create a visual progress bar for context usage.
@@ -175,30 +262,22 @@ def get_progress_bar(percentage: float, width: int = 40) -> str:
     Returns:
         String representation of a progress bar
     """
-    filled = int((percentage / 100) * width)
-    empty = width - filled
+    filled = min(max(int((percentage / 100) * width), 0), width)
+    bar_body = _render_bar(filled, width)
 
     # Color coding based on usage
-    if percentage < 50:
-        bar_char = '█'
-        label = 'LOW'
-    elif percentage < 80:
-        bar_char = '█'
-        label = 'MEDIUM'
-    else:
-        bar_char = '█'
-        label = 'HIGH'
+    label = _LEVEL_LABELS[bisect_right(_LEVEL_THRESHOLDS, percentage)]
 
-    bar = f"[{bar_char * filled}{'-' * empty}] {percentage:.1f}% ({label})"
+    bar = f"[{bar_body}] {percentage:.1f}% ({label})"
     return bar
 
 
-def get_warning_message(usage_stats: Dict[str, Any]) -> Optional[str]:
+def get_warning_message(usage_stats: Union[Interaction, Dict[str, Any]]) -> Optional[str]:
     """
     Get a warning message if context usage is high.
 
     Args:
-        usage_stats: Dictionary containing token usage statistics
+        usage_stats: Interaction (or dict) with token usage statistics
 
     Returns:
         Warning message if needed, None otherwise
@@ -215,12 +294,12 @@ def get_warning_message(usage_stats: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def display_token_usage(usage_stats: Dict[str, Any]) -> None:
+def display_token_usage(usage_stats: Union[Interaction, Dict[str, Any]]) -> None:
     """
     Display token usage statistics to the console.
 
     Args:
-        usage_stats: Dictionary containing token usage statistics from track_interaction()
+        usage_stats: Interaction (or dict) with token usage statistics from track_interaction()
     """
     print("\n" + "-" * 70)
     print("TOKEN USAGE (Ollama actual):")
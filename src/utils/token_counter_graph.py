@@ -6,10 +6,27 @@ and integrating it into LangGraph state, allowing for reactive behavior
 based on context usage.
 """
 
+import logging
 from typing import Dict
-from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.messages import SystemMessage
 from src.graph.state import F150StateWithDualContext
 from src.config import Config
+from src.utils.telemetry import get_telemetry_logger
+from src.utils.token_counter_chain import get_progress_bar
+
+
+# One record per turn; formatted only if the telemetry logger is enabled for INFO
+_TOKEN_USAGE_TEMPLATE = (
+    "\n" + "-" * 70 + "\n"
+    "TOKEN USAGE (Ollama actual):\n"
+    "  Prompt: {prompt_tokens:,} tokens\n"
+    "  Completion: {completion_tokens:,} tokens\n"
+    "  This interaction: {interaction_tokens:,} tokens\n"
+    "  Cumulative: {cumulative_tokens:,} / {context_limit:,} tokens ({usage_percentage:.1f}%)\n"
+    "  Remaining: {remaining_tokens:,} tokens\n"
+    "\nContext: {progress_bar}\n"
+    + "-" * 70
+)
 
 
 def create_token_tracking_node(context_limit: int = 128000, warning_threshold: float = 80.0):
@@ -17,7 +34,7 @@ def create_token_tracking_node(context_limit: int = 128000, warning_threshold: f
     Factory function to create a token tracking node for LangGraph.
 
     This creates a node that:
-    - Extracts token counts from Ollama response metadata
+    - Reads the token counts of the agent's latest Ollama call from state
     - Updates cumulative token counts in graph state
     - Calculates usage percentage and remaining tokens
     - Optionally injects warning messages into the conversation
@@ -34,11 +51,15 @@ def create_token_tracking_node(context_limit: int = 128000, warning_threshold: f
         >>> workflow.add_node("token_tracker", create_token_tracking_node(128000, 80.0))
     """
 
+    # Read once per node build; the flag does not change at runtime
+    telemetry = Config.TELEMETRY
+    logger = get_telemetry_logger()
+
     def token_tracking_node(state: F150StateWithDualContext) -> Dict:
         """
-        Token tracking node that processes the last AI message.
+        Token tracking node that processes the agent's latest LLM call.
 
-        This node extracts token usage from Ollama's response metadata,
+        This node reads the Ollama token counts the agent node put in state,
         updates the cumulative totals in state, and optionally injects
         warning messages if context usage is high.
 
@@ -48,47 +69,34 @@ def create_token_tracking_node(context_limit: int = 128000, warning_threshold: f
         Returns:
             Dictionary with updated token counts and optional warning message
         """
-        if Config.TELEMETRY:
-            print("\n📊 TOKEN_TRACKER: Tracking token usage...")
-
-        messages = state["messages"]
-
-        # Find the last AI message with response metadata
-        last_ai_message = None
-        for msg in reversed(messages):
-            if isinstance(msg, AIMessage) and hasattr(msg, 'response_metadata'):
-                last_ai_message = msg
-                break
+        if telemetry:
+            logger.info("\n📊 TOKEN_TRACKER: Tracking token usage...")
 
-        if not last_ai_message:
-            if Config.TELEMETRY:
-                print("  (No AI message to track)")
-            return {}  # No AI message to track
-
-        # Extract token counts from Ollama metadata
-        metadata = last_ai_message.response_metadata
-        prompt_tokens = metadata.get('prompt_eval_count', 0)
-        completion_tokens = metadata.get('eval_count', 0)
+        # Token counts of the agent's latest LLM call (set by the agent node)
+        prompt_tokens = state.get("last_prompt_tokens", 0)
+        completion_tokens = state.get("last_completion_tokens", 0)
 
         if prompt_tokens == 0 and completion_tokens == 0:
             # No token data available from Ollama
-            print("\n⚠️  Token tracking unavailable - Ollama did not return token counts")
+            logger.info("\n⚠️  Token tracking unavailable - Ollama did not return token counts")
             return {}
 
-        # Update cumulative totals
-        new_total_prompt = state.get("total_prompt_tokens", 0) + prompt_tokens
-        new_total_completion = state.get("total_completion_tokens", 0) + completion_tokens
-        new_total_tokens = new_total_prompt + new_total_completion
+        # Cumulative totals after this call (for display and warnings only)
+        interaction_tokens = prompt_tokens + completion_tokens
+        new_total_tokens = (
+            state.get("total_prompt_tokens", 0) + state.get("total_completion_tokens", 0)
+            + interaction_tokens
+        )
 
         # Calculate usage metrics
         usage_percentage = (new_total_tokens / context_limit) * 100
         remaining_tokens = context_limit - new_total_tokens
 
-        # Build state updates
+        # Build state updates: the totals' add reducers accumulate these increments
         updates = {
-            "total_prompt_tokens": new_total_prompt,
-            "total_completion_tokens": new_total_completion,
-            "total_tokens": new_total_tokens,
+            "total_prompt_tokens": prompt_tokens,
+            "total_completion_tokens": completion_tokens,
+            "total_tokens": interaction_tokens,
             "context_limit": context_limit,
         }
 
@@ -96,7 +104,7 @@ def create_token_tracking_node(context_limit: int = 128000, warning_threshold: f
         display_token_usage(
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
-            interaction_tokens=prompt_tokens + completion_tokens,
+            interaction_tokens=interaction_tokens,
             cumulative_tokens=new_total_tokens,
             context_limit=context_limit,
             usage_percentage=usage_percentage,
@@ -125,6 +133,9 @@ def display_token_usage(
     """
     Display token usage statistics to the console.
 
+    Written as one record through the telemetry logger, so nothing is
+    formatted when INFO is disabled and stdout is written off-thread.
+
     Args:
         prompt_tokens: Tokens used in the prompt
         completion_tokens: Tokens used in the completion
@@ -134,45 +145,20 @@ def display_token_usage(
         usage_percentage: Percentage of context used
         remaining_tokens: Tokens remaining in context
     """
-    print("\n" + "-" * 70)
-    print("TOKEN USAGE (Ollama actual):")
-    print(f"  Prompt: {prompt_tokens:,} tokens")
-    print(f"  Completion: {completion_tokens:,} tokens")
-    print(f"  This interaction: {interaction_tokens:,} tokens")
-    print(f"  Cumulative: {cumulative_tokens:,} / {context_limit:,} tokens ({usage_percentage:.1f}%)")
-    print(f"  Remaining: {remaining_tokens:,} tokens")
-
-    # Display progress bar
-    progress_bar = get_progress_bar(usage_percentage)
-    print(f"\nContext: {progress_bar}")
-
-    print("-" * 70)
-
-
-def get_progress_bar(percentage: float, width: int = 40) -> str:
-    """
-    Create a visual progress bar for context usage.
-
-    Args:
-        percentage: Usage percentage (0-100)
-        width: Width of the progress bar in characters (default: 40)
-
-    Returns:
-        String representation of a progress bar
-    """
-    filled = int((percentage / 100) * width)
-    empty = width - filled
-
-    # Color coding based on usage
-    if percentage < 50:
-        label = 'LOW'
-    elif percentage < 80:
-        label = 'MEDIUM'
-    else:
-        label = 'HIGH'
-
-    bar = f"[{'█' * filled}{'-' * empty}] {percentage:.1f}% ({label})"
-    return bar
+    logger = get_telemetry_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info(_TOKEN_USAGE_TEMPLATE.format(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        interaction_tokens=interaction_tokens,
+        cumulative_tokens=cumulative_tokens,
+        context_limit=context_limit,
+        usage_percentage=usage_percentage,
+        remaining_tokens=remaining_tokens,
+        progress_bar=get_progress_bar(usage_percentage)
+    ))
 
 
 def get_warning_message(usage_percentage: float, remaining_tokens: int) -> str | None:
@@ -0,0 +1,85 @@
+"""Test script for checkpointing graph state to SQLite."""
+
+import os
+import sqlite3
+import tempfile
+
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.graph import END, START, StateGraph
+
+from src import checkpointer
+from src.config import Config
+from src.graph.state import F150StateWithDualContext, retrieved_batch
+
+
+def _rag_like_node(state):
+    """Stand-in for the agentic RAG node: returns a retrieved batch and a message."""
+    batch = retrieved_batch([
+        Document(page_content="Fuse 33 is 15A.", metadata={"page": 212}),
+        Document(page_content="No page metadata."),
+    ])
+    return {"retrieved_documents": batch, "messages": [AIMessage(content="done")]}
+
+
+def test_state_round_trip():
+    """Test that RAG state saved by get_checkpointer() loads back from a new connection."""
+    print("=" * 70)
+    print("TEST 1: Checkpoint Save/Load Round Trip")
+    print("=" * 70)
+
+    original_db_path = Config.CHECKPOINT_DB_PATH
+    original_checkpointer = checkpointer._checkpointer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "conversations.db")
+        Config.CHECKPOINT_DB_PATH = db_path
+        checkpointer._checkpointer = None
+        reader = None
+        try:
+            workflow = StateGraph(F150StateWithDualContext)
+            workflow.add_node("rag", _rag_like_node)
+            workflow.add_edge(START, "rag")
+            workflow.add_edge("rag", END)
+            graph = workflow.compile(checkpointer=checkpointer.get_checkpointer())
+
+            config = {"configurable": {"thread_id": "round-trip"}}
+            graph.invoke({"messages": [HumanMessage(content="What is fuse 33?")]}, config)
+
+            # Read back through a separate saver so the state is really deserialized
+            reader = SqliteSaver(sqlite3.connect(db_path, check_same_thread=False))
+            values = reader.get_tuple(config).checkpoint["channel_values"]
+
+            print(f"\nRetrieved documents: {values['retrieved_documents']}")
+            assert values["retrieved_documents"] == {
+                "pages": [212, -1],
+                "contents": ["Fuse 33 is 15A.", "No page metadata."],
+            }
+            assert [m.content for m in values["messages"]] == ["What is fuse 33?", "done"]
+        finally:
+            # Don't leak the temporary database into later tests
+            if reader is not None:
+                reader.conn.close()
+            if checkpointer._checkpointer is not None:
+                checkpointer._checkpointer.conn.close()
+            checkpointer._checkpointer = original_checkpointer
+            Config.CHECKPOINT_DB_PATH = original_db_path
+
+    print("\n✓ Test 1 passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("\nCHECKPOINTER TEST SUITE")
+    print("=" * 70)
+
+    test_state_round_trip()
+
+    print("=" * 70)
+    print("ALL TESTS PASSED!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
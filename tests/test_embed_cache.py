@@ -0,0 +1,116 @@
+"""Test script for the content-addressed embedding cache."""
+
+import os
+import sqlite3
+import tempfile
+
+from src.rag.embed_cache import EmbedCache
+
+
+class CountingEmbedder:
+    """Fake embed_documents that records what it was asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+def test_hit_and_miss():
+    """Test that only texts never embedded before reach the embedder."""
+    print("=" * 70)
+    print("TEST 1: Cache Hit and Miss")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbedCache(os.path.join(tmp, "embeddings.db"))
+        embedder = CountingEmbedder()
+
+        first = cache.get_or_compute_many(["tow", "fuse"], "model-a", embedder.embed_documents)
+        second = cache.get_or_compute_many(["fuse", "tire", "tow"], "model-a", embedder.embed_documents)
+
+        print(f"\nEmbedder calls: {embedder.calls}")
+        assert embedder.calls == [["tow", "fuse"], ["tire"]], "Cached texts should not be re-embedded"
+        assert first == [[3.0, 0.5], [4.0, 0.5]]
+        assert second == [[4.0, 0.5], [4.0, 0.5], [3.0, 0.5]], "Results should be in input order"
+
+        # A fresh instance reads the same file
+        reopened = EmbedCache(os.path.join(tmp, "embeddings.db"))
+        assert reopened.get_or_compute_many(["tire"], "model-a", embedder.embed_documents) == [[4.0, 0.5]]
+        assert len(embedder.calls) == 2
+
+    print("\n✓ Test 1 passed\n")
+
+
+def test_models_do_not_mix():
+    """Test that the same text under another model is a miss."""
+    print("=" * 70)
+    print("TEST 2: Keys Include the Model")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbedCache(os.path.join(tmp, "embeddings.db"))
+        embedder = CountingEmbedder()
+
+        cache.get_or_compute_many(["tow"], "model-a", embedder.embed_documents)
+        cache.get_or_compute_many(["tow"], "model-b", embedder.embed_documents)
+
+        print(f"\nEmbedder calls: {embedder.calls}")
+        assert embedder.calls == [["tow"], ["tow"]]
+
+    print("\n✓ Test 2 passed\n")
+
+
+class RecordingEmbedCache(EmbedCache):
+    """EmbedCache that keeps every connection it opens, to check they get closed."""
+
+    def __init__(self, path):
+        self.opened = []
+        super().__init__(path)
+
+    def _connect(self):
+        conn = super()._connect()
+        self.opened.append(conn)
+        return conn
+
+
+def test_connections_closed():
+    """Test that no SQLite connection is left open after a call."""
+    print("=" * 70)
+    print("TEST 3: Connections Are Closed")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = RecordingEmbedCache(os.path.join(tmp, "embeddings.db"))
+        cache.get_or_compute_many(["tow", "fuse"], "model-a", CountingEmbedder().embed_documents)
+
+        print(f"\nConnections opened: {len(cache.opened)}")
+        assert len(cache.opened) == 2
+        for conn in cache.opened:
+            try:
+                conn.execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                continue
+            raise AssertionError("Connection was left open")
+
+    print("\n✓ Test 3 passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("\nEMBEDDING CACHE TEST SUITE")
+    print("=" * 70)
+
+    test_hit_and_miss()
+    test_models_do_not_mix()
+    test_connections_closed()
+
+    print("=" * 70)
+    print("ALL TESTS PASSED!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -158,6 +158,64 @@ def test_progress_bar():
     print("\n✓ Test 5 passed\n")
 
 
+def test_interaction_access():
+    """Test attribute and item access on the returned Interaction."""
+    print("=" * 70)
+    print("TEST 6: Interaction Access")
+    print("=" * 70)
+
+    counter = OllamaTokenCounter(context_limit=1000)
+    counter.track_interaction(100, 150)
+    stats = counter.track_interaction(50, 200)
+
+    print(f"\nInteraction: {stats}")
+    assert stats['prompt_tokens'] == stats.prompt_tokens == 50
+    assert stats['completion_tokens'] == 200
+    assert stats['interaction_tokens'] == 250
+    assert stats['cumulative_tokens'] == 500
+    assert stats['usage_percentage'] == stats.usage_percentage == 50.0
+    assert stats['remaining_tokens'] == 500
+
+    try:
+        stats['not_a_field']
+    except KeyError as e:
+        print(f"Unknown key raises KeyError: {e}")
+    else:
+        raise AssertionError("Unknown keys should raise KeyError")
+
+    print("\n✓ Test 6 passed\n")
+
+
+def test_message_history():
+    """Test that message_history is rebuilt only when keep_history is set."""
+    print("=" * 70)
+    print("TEST 7: Message History")
+    print("=" * 70)
+
+    # Past the initial 1024 preallocated rows, so the array has to grow
+    counter = OllamaTokenCounter(context_limit=10_000_000, keep_history=True)
+    returned = [counter.track_interaction(i, 2 * i + 1) for i in range(1500)]
+
+    history = counter.message_history
+    print(f"\nHistory length: {len(history)}")
+    print(f"Last entry: {history[-1]}")
+    assert history == returned, "History should equal what track_interaction returned"
+
+    counter.reset()
+    assert counter.message_history == []
+
+    # Default: interactions are counted, not recorded
+    counter = OllamaTokenCounter()
+    counter.track_interaction(10, 20)
+    counter.track_interaction(30, 40)
+
+    print(f"Default history: {counter.message_history}")
+    assert counter.message_history == []
+    assert counter.get_summary()['total_interactions'] == 2
+
+    print("\n✓ Test 7 passed\n")
+
+
 def main():
     """Run all tests."""
     print("\nOLLAMA TOKEN COUNTER TEST SUITE")
@@ -169,6 +227,8 @@ def main():
         test_warnings()
         test_summary()
         test_progress_bar()
+        test_interaction_access()
+        test_message_history()
 
         print("=" * 70)
         print("ALL TESTS PASSED!")
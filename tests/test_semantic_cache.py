@@ -0,0 +1,148 @@
+"""Test script for the semantic prompt cache."""
+
+import unittest
+
+import numpy as np
+
+from src.cache import _simd
+from src.cache import SemanticCache, forget_query_vector, recall_query_vector, remember_query_vector
+
+
+class KeywordEmbeddings:
+    """Tiny fake embedder: one dimension per keyword, so tests don't need Ollama."""
+
+    KEYWORDS = ["tow", "tire", "fuse"]
+
+    def embed_query(self, text):
+        text = text.lower()
+        return [1.0 if keyword in text else 0.0 for keyword in self.KEYWORDS]
+
+
+def test_hit_and_miss():
+    """Test that similar questions hit and unrelated questions miss."""
+    print("=" * 70)
+    print("TEST 1: Cache Hit and Miss")
+    print("=" * 70)
+
+    cache = SemanticCache(KeywordEmbeddings(), threshold=0.95)
+
+    vector = cache.embed("What is the towing capacity?")
+    assert cache.lookup(vector) is None, "Empty cache should miss"
+
+    cache.store(vector, "11,100 lbs")
+
+    hit = cache.lookup(cache.embed("How much can I tow?"))
+    miss = cache.lookup(cache.embed("What tire pressure should I use?"))
+
+    print(f"\nParaphrase lookup: {hit}")
+    print(f"Unrelated lookup: {miss}")
+    assert hit == "11,100 lbs"
+    assert miss is None
+
+    print("\n✓ Test 1 passed\n")
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted when full."""
+    print("=" * 70)
+    print("TEST 2: LRU Eviction")
+    print("=" * 70)
+
+    cache = SemanticCache(KeywordEmbeddings(), threshold=0.95, max_entries=2)
+
+    cache.store(cache.embed("tow"), "towing answer")
+    cache.store(cache.embed("tire"), "tire answer")
+
+    # Touch "tow" so "tire" becomes least recently used
+    cache.lookup(cache.embed("tow"))
+    cache.store(cache.embed("fuse"), "fuse answer")
+
+    print(f"\nEntries: {len(cache)}")
+    assert len(cache) == 2
+    assert cache.lookup(cache.embed("tow")) == "towing answer"
+    assert cache.lookup(cache.embed("fuse")) == "fuse answer"
+    assert cache.lookup(cache.embed("tire")) is None, "LRU entry should be evicted"
+
+    print("\n✓ Test 2 passed\n")
+
+
+def test_embed_message_reuses_remembered_vector():
+    """Test that a vector remembered for the question is used instead of re-embedding."""
+    print("=" * 70)
+    print("TEST 3: Reuse Remembered Query Embedding")
+    print("=" * 70)
+
+    cache = SemanticCache(KeywordEmbeddings())
+
+    # Remembered vector says "fuse" even though the text is about towing
+    remember_query_vector("tow", np.array([0.0, 0.0, 1.0], dtype=np.float32))
+    vector = cache.embed_message("tow")
+
+    print(f"\nVector: {vector.tolist()}")
+    assert vector.tolist() == [0.0, 0.0, 1.0], "Remembered vector should be used"
+
+    forget_query_vector("tow")
+    assert cache.embed_message("tow").tolist() == [1.0, 0.0, 0.0]
+    assert recall_query_vector("tow").tolist() == [1.0, 0.0, 0.0], "Fresh vector should be remembered"
+    forget_query_vector("tow")
+
+    print("\n✓ Test 3 passed\n")
+
+
+def test_numba_kernel_matches_numpy():
+    """Test that the numba and NumPy similarity kernels agree."""
+    print("=" * 70)
+    print("TEST 4: Numba Kernel vs NumPy Fallback")
+    print("=" * 70)
+
+    if _simd.njit is None:
+        raise unittest.SkipTest("numba is not installed (uv sync --extra numba)")
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((200, 64)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    quantized = [_simd.quantize(vector) for vector in vectors]
+    mat = np.stack([q for q, _ in quantized])
+    scales = np.array([scale for _, scale in quantized], dtype=np.float32)
+
+    numba_scores = _simd._numba_dot_scores(mat, mat[42])
+    numpy_scores = _simd._numpy_dot_scores(mat, mat[42])
+    assert np.array_equal(numba_scores, numpy_scores), "Integer dot products should match exactly"
+
+    # argmax_cosine through each kernel
+    best_numba = _simd.argmax_cosine(mat, scales, mat[42], scales[42])
+    _simd._dot_scores = _simd._numpy_dot_scores
+    try:
+        best_numpy = _simd.argmax_cosine(mat, scales, mat[42], scales[42])
+    finally:
+        _simd._dot_scores = _simd._numba_dot_scores
+
+    print(f"\nnumba: {best_numba}")
+    print(f"numpy: {best_numpy}")
+    assert best_numba[0] == best_numpy[0] == 42
+    assert np.isclose(best_numba[1], best_numpy[1])
+    assert abs(best_numba[1] - 1.0) < 0.01, "A vector should be ~1.0 similar to itself"
+
+    print("\n✓ Test 4 passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("\nSEMANTIC CACHE TEST SUITE")
+    print("=" * 70)
+
+    test_hit_and_miss()
+    test_lru_eviction()
+    test_embed_message_reuses_remembered_vector()
+    try:
+        test_numba_kernel_matches_numpy()
+    except unittest.SkipTest as e:
+        print(f"Test 4 skipped: {e}\n")
+
+    print("=" * 70)
+    print("ALL TESTS PASSED!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,12 @@ def main():
     print()
     print("This will:")
     print("  1. Load the F150 manual PDF (641 pages)")
-    print("  2. Split into chunks (1649 chunks)")
+    print("  2. Split into chunks (~1510 chunks)")
     print("  3. Generate embeddings for each chunk")
     print("  4. Build FAISS index for similarity search")
     print("  5. Test with sample queries")
     print()
-    print("⏳ This may take 2-5 minutes (embedding 1649 chunks)...")
+    print("⏳ This may take 2-5 minutes (embedding ~1510 chunks)...")
     print()
 
     try:
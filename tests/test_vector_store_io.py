@@ -0,0 +1,161 @@
+"""Test script for saving, loading and searching a vector store without Ollama."""
+
+import os
+import tempfile
+
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+
+from src.config import Config
+from src.rag.vector_store import (
+    create_vector_store,
+    get_chunk_vectors,
+    load_vector_store,
+    save_vector_store,
+    similarity_search_reranked,
+)
+
+
+DIMENSION = 8
+
+
+def _build_store(index: faiss.Index, num_chunks: int = 20) -> FAISS:
+    """Build a store with random chunk vectors (no embedding server needed)."""
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((num_chunks, DIMENSION)).astype(np.float32)
+    if not index.is_trained:
+        index.train(vectors)
+
+    store = FAISS(
+        embedding_function=None,
+        index=index,
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={}
+    )
+    store.add_embeddings(
+        text_embeddings=[(f"chunk {i}", vector.tolist()) for i, vector in enumerate(vectors)],
+        metadatas=[{"page": i} for i in range(num_chunks)]
+    )
+    store.chunk_vectors = vectors
+    return store
+
+
+def test_save_load_round_trip():
+    """Test that index, chunks and exact vectors survive save → load."""
+    print("=" * 70)
+    print("TEST 1: Save/Load Round Trip")
+    print("=" * 70)
+
+    store = _build_store(faiss.IndexHNSWFlat(DIMENSION, 8))
+    query = get_chunk_vectors(store)[7]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_vector_store(store, tmp)
+        print(f"\nSaved files: {sorted(os.listdir(tmp))}")
+        assert sorted(os.listdir(tmp)) == ["docstore.json", "index.faiss", "vectors.npy"]
+
+        loaded = load_vector_store(tmp)
+
+        assert loaded.index.ntotal == store.index.ntotal
+        assert np.array_equal(get_chunk_vectors(loaded), get_chunk_vectors(store))
+        for row, doc_id in store.index_to_docstore_id.items():
+            original = store.docstore.search(doc_id)
+            restored = loaded.docstore.search(loaded.index_to_docstore_id[row])
+            assert restored.page_content == original.page_content
+            assert restored.metadata == original.metadata
+
+        top = loaded.similarity_search_by_vector(query.tolist(), k=1)[0]
+        print(f"Nearest chunk to chunk 7's vector: {top.page_content}")
+        assert top.page_content == "chunk 7"
+
+    print("\n✓ Test 1 passed\n")
+
+
+def test_reranked_ordering():
+    """Test that re-scored results come back in exact-distance order."""
+    print("=" * 70)
+    print("TEST 2: Reranked Search Ordering")
+    print("=" * 70)
+
+    # 4-bit scalar quantization: coarse enough that exact re-scoring matters
+    index = faiss.IndexScalarQuantizer(DIMENSION, faiss.ScalarQuantizer.QT_4bit)
+    store = _build_store(index, num_chunks=50)
+
+    query = np.random.default_rng(1).standard_normal(DIMENSION).astype(np.float32)
+    exact = ((get_chunk_vectors(store) - query) ** 2).sum(axis=1)
+    expected = [f"chunk {row}" for row in np.argsort(exact, kind="stable")[:5]]
+
+    # Re-scoring every chunk must reproduce the brute-force top-k exactly
+    results = similarity_search_reranked(store, query.tolist(), k=5, fetch_k=50)
+    print(f"\nReranked: {[doc.page_content for doc in results]}")
+    print(f"Expected: {expected}")
+    assert [doc.page_content for doc in results] == expected
+
+    # With a smaller candidate set, results are still sorted by exact distance
+    results = similarity_search_reranked(store, query.tolist(), k=5, fetch_k=10)
+    distances = [exact[doc.metadata["page"]] for doc in results]
+    assert len(results) == 5
+    assert distances == sorted(distances)
+
+    print("\n✓ Test 2 passed\n")
+
+
+def test_reranked_flat_fallback():
+    """Test that exact flat indexes are searched directly."""
+    print("=" * 70)
+    print("TEST 3: Flat Index Fallback")
+    print("=" * 70)
+
+    store = _build_store(faiss.IndexFlatL2(DIMENSION))
+    query = get_chunk_vectors(store)[3].tolist()
+
+    reranked = similarity_search_reranked(store, query, k=4, fetch_k=20)
+    direct = store.similarity_search_by_vector(query, k=4)
+
+    print(f"\nReranked: {[doc.page_content for doc in reranked]}")
+    assert [doc.page_content for doc in reranked] == [doc.page_content for doc in direct]
+    assert reranked[0].page_content == "chunk 3"
+
+    print("\n✓ Test 3 passed\n")
+
+
+def test_empty_chunks():
+    """Test that building a store from no chunks fails with a clear error."""
+    print("=" * 70)
+    print("TEST 4: Empty Chunks")
+    print("=" * 70)
+
+    embed_cache_enabled = Config.EMBED_CACHE_ENABLED
+    Config.EMBED_CACHE_ENABLED = False
+    try:
+        create_vector_store([])
+    except ValueError as e:
+        print(f"\nValueError: {e}")
+        assert "No text chunks" in str(e)
+    else:
+        raise AssertionError("Empty chunks should raise ValueError")
+    finally:
+        Config.EMBED_CACHE_ENABLED = embed_cache_enabled
+
+    print("\n✓ Test 4 passed\n")
+
+
+def main():
+    """Run all tests."""
+    print("\nVECTOR STORE I/O TEST SUITE")
+    print("=" * 70)
+
+    test_save_load_round_trip()
+    test_reranked_ordering()
+    test_reranked_flat_fallback()
+    test_empty_chunks()
+
+    print("=" * 70)
+    print("ALL TESTS PASSED!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()